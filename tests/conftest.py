@@ -7,6 +7,7 @@ sys.path.insert(0, os.path.join(TEST_PATH, '..'))
 
 import pytest
 from pyvirtualdisplay import Display
+from selenium.webdriver.remote.command import Command
 
 import webdriverwrapper
 from webdriverwrapper.pytest import *
@@ -30,6 +31,37 @@ def session_driver():
     return driver
 
 
+class CommandExecutorMock:
+    """
+    Command executor answering without any browser. All commands are recorded
+    so tests can check how many round trips were made. Responses can be set
+    by name of command as value or callable getting params of command.
+    """
+
+    w3c = True
+
+    def __init__(self):
+        self.commands = []
+        self.responses = {}
+
+    def execute(self, command, params):
+        if command == Command.NEW_SESSION:
+            return {'value': {'sessionId': 'mock', 'capabilities': {}}}
+        self.commands.append((command, params))
+        response = self.responses.get(command)
+        if callable(response):
+            response = response(params)
+        return {'value': response}
+
+    def count(self, *commands):
+        return len([command for command, params in self.commands if not commands or command in commands])
+
+
+@pytest.fixture
+def mocked_driver():
+    return webdriverwrapper.Remote(command_executor=CommandExecutorMock(), desired_capabilities={})
+
+
 @pytest.fixture(scope='function')
 def _driver(session_driver):
     session_driver.get('file://{}/html/some_page.html'.format(TEST_PATH))
@@ -0,0 +1,94 @@
+import os
+import time
+
+import pytest
+from selenium.webdriver.firefox.webelement import FirefoxWebElement
+from selenium.webdriver.remote.command import Command
+
+from webdriverwrapper.wrapper import _ConvertToWebelementWrapper, _WebElementWrapper
+
+
+#  Measured time depends on machine, so benchmarks run only when environment
+#+ variable WEBDRIVERWRAPPER_BENCHMARK is set.
+benchmark = pytest.mark.skipif(
+    not os.environ.get('WEBDRIVERWRAPPER_BENCHMARK'),
+    reason='set WEBDRIVERWRAPPER_BENCHMARK to run benchmarks',
+)
+
+
+def _measure(callback):
+    start = time.time()
+    result = callback()
+    return result, time.time() - start
+
+
+def _wrap_firefox_elements(count):
+    webelements = [FirefoxWebElement(None, str(index), w3c=True) for index in range(count)]
+    return [
+        _ConvertToWebelementWrapper._convert_into_webelementwrapper(webelement, 'div')
+        for webelement in webelements
+    ]
+
+
+def test_wrap_firefox_elements():
+    wrapped = _wrap_firefox_elements(100)
+    assert len(set(type(elm) for elm in wrapped)) == 1
+    assert isinstance(wrapped[0], _WebElementWrapper)
+    assert isinstance(wrapped[0], FirefoxWebElement)
+
+
+@benchmark
+def test_benchmark_wrap_firefox_elements():
+    _, duration = _measure(lambda: _wrap_firefox_elements(10000))
+    print('Wrapping of 10k elements: {:.3f}s'.format(duration))
+    assert duration < 1
+
+
+def test_find_elements_overhead(mocked_driver):
+    mocked_driver.command_executor.responses[Command.FIND_ELEMENTS] = []
+    for _ in range(100):
+        mocked_driver.find_elements_by_id('id')
+    assert mocked_driver.command_executor.count() == mocked_driver.command_executor.count(Command.FIND_ELEMENTS) == 100
+
+
+@benchmark
+def test_benchmark_find_elements_overhead(mocked_driver):
+    mocked_driver.command_executor.responses[Command.FIND_ELEMENTS] = []
+    _, duration = _measure(lambda: [mocked_driver.find_elements_by_id('id') for _ in range(10000)])
+    print('10k calls of find_elements: {:.3f}s'.format(duration))
+    assert duration < 1
+
+
+@benchmark
+def test_benchmark_extract_big_table(driver, tmpdir):
+    html = tmpdir.join('table.html')
+    html.write('<table><tr>{}</tr>{}</table>'.format(
+        ''.join('<th>col{}</th>'.format(col) for col in range(10)),
+        ''.join('<tr>{}</tr>'.format(''.join('<td>{}</td>'.format(col) for col in range(10))) for _ in range(10000)),
+    ))
+    driver.get('file://{}'.format(html))
+    table = driver.get_elm(tag_name='table')
+
+    rows, duration = _measure(table.extract_table)
+    print('Extracting of table with 100k cells: {:.3f}s'.format(duration))
+    assert len(rows) == 10000
+    assert rows[0]['col9'] == '9'
+
+    rows, duration = _measure(lambda: list(table.iter_table(chunk_size=2000)))
+    print('Extracting of table with 100k cells by chunks: {:.3f}s'.format(duration))
+    assert len(rows) == 10000
+
+
+@benchmark
+def test_benchmark_fill_out_big_multiple_select(driver, tmpdir):
+    html = tmpdir.join('select.html')
+    html.write('<form><select name="multiselect" multiple="multiple">{}</select></form>'.format(
+        ''.join('<option value="value{0}">{0}</option>'.format(index) for index in range(500)),
+    ))
+    driver.get('file://{}'.format(html))
+    values = ['value{}'.format(index) for index in range(0, 500, 2)]
+
+    _, duration = _measure(lambda: driver.fill_out({'multiselect': values}))
+    print('Filling out of multiple select with 500 options: {:.3f}s'.format(duration))
+    selected = driver.get_elm(name='multiselect').all_selected_options
+    assert [option.get_attribute('value') for option in selected] == values
@@ -1,3 +1,15 @@
+import hashlib
+import http.server
+import io
+import threading
+
+import pytest
+import requests
+from selenium.webdriver.remote.command import Command
+
+from webdriverwrapper.download import _get_session
+
+
 def test_download_page_by_url(driver):
     result = driver.download_url('http://www.google.com')
     assert 'Google' in result.data
@@ -27,3 +39,252 @@ def test_download_file_by_form(driver):
     form.fill_out({'q': 'selenium'})
     result = form.download_file()
     assert 'selenium' in result.data
+
+
+def test_download_file_by_form_by_one_call(mocked_driver, monkeypatch):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.FIND_ELEMENTS] = [{'ELEMENT': 'btn'}]
+    executor.responses[Command.GET_ELEMENT_TAG_NAME] = 'input'
+    executor.responses[Command.GET_ALL_COOKIES] = [{'name': 'session', 'value': 'abc', 'domain': 'example.com'}]
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = {'href': None, 'form': {
+        'action': 'http://example.com/export',
+        'method': 'post',
+        'data': [['multiselect', 'value1'], ['key', 'val'], ['multiselect', 'value2']],
+    }}
+    btn = mocked_driver.get_elm('btn-post-with-data')
+    requests_made = []
+    monkeypatch.setattr(requests.Session, 'post', lambda session, url, **kwds: requests_made.append((url, kwds, dict(session.cookies))))
+    del executor.commands[:]
+    btn.download_file()
+    assert requests_made == [('http://example.com/export', {
+        'data': [('multiselect', 'value1'), ('key', 'val'), ('multiselect', 'value2')],
+        'stream': False,
+    }, {'session': 'abc'})]
+    assert executor.count() == 2
+
+
+def test_download_file_by_post_form_can_not_force_head(mocked_driver, monkeypatch):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.FIND_ELEMENTS] = [{'ELEMENT': 'btn'}]
+    executor.responses[Command.GET_ELEMENT_TAG_NAME] = 'input'
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = {'href': None, 'form': {
+        'action': 'http://example.com/export',
+        'method': 'post',
+        'data': [['key', 'val']],
+    }}
+    monkeypatch.setattr(requests.Session, 'request', lambda *args, **kwds: pytest.fail('no request expected'))
+    with pytest.raises(Exception) as excinfo:
+        mocked_driver.get_elm('btn').download_file(method='head')
+    assert 'post' in str(excinfo.value)
+    assert executor.count(Command.GET_ALL_COOKIES) == 0
+
+
+def test_downloads_share_session(mocked_driver, monkeypatch):
+    executor = mocked_driver.command_executor
+    cookies = [
+        {'name': 'session', 'value': 'abc', 'domain': 'example.com'},
+        {'name': 'lang', 'value': 'en', 'domain': '.example.com', 'path': '/'},
+    ]
+    executor.responses[Command.GET_ALL_COOKIES] = lambda params: list(cookies)
+    requests_made = []
+    monkeypatch.setattr(requests.Session, 'get', lambda session, url, **kwds: requests_made.append((session, dict(session.cookies))))
+    mocked_driver.download_url('http://example.com/first')
+    cookies[0] = {'name': 'session', 'value': 'def', 'domain': 'example.com'}
+    del cookies[1]
+    mocked_driver.download_url('http://example.com/second')
+    assert requests_made[0][0] is requests_made[1][0]
+    assert requests_made[0][1] == {'session': 'abc', 'lang': 'en'}
+    assert requests_made[1][1] == {'session': 'def'}
+
+
+def test_download_sends_cookies_only_to_their_hosts(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.GET_ALL_COOKIES] = [
+        {'name': 'session', 'value': 'abc', 'domain': 'app.example.com', 'path': '/'},
+        {'name': 'lang', 'value': 'en', 'domain': '.example.com', 'path': '/'},
+        {'name': 'admin', 'value': 'yes', 'domain': 'app.example.com', 'path': '/admin'},
+        {'name': 'secure', 'value': 'yes', 'domain': 'app.example.com', 'path': '/', 'secure': True},
+        {'name': 'local', 'value': 'yes', 'domain': 'localhost', 'path': '/'},
+    ]
+    session = _get_session(mocked_driver)
+
+    def get_cookie_header(url):
+        return session.prepare_request(requests.Request('GET', url)).headers.get('Cookie')
+    assert get_cookie_header('http://app.example.com/') == 'session=abc; lang=en'
+    assert get_cookie_header('https://app.example.com/admin/') == 'admin=yes; session=abc; secure=yes; lang=en'
+    assert get_cookie_header('http://www.example.com/') == 'lang=en'
+    # Host-only cookie can't be told from domain one by cookie jar.
+    assert get_cookie_header('http://sub.app.example.com/') == 'session=abc; lang=en'
+    assert get_cookie_header('http://evil.example.org/') is None
+    assert get_cookie_header('http://localhost:8000/') == 'local=yes'
+
+
+def test_download_by_stream(mocked_driver, monkeypatch, tmpdir):
+    body = b''.join(b'line %d\n' % index for index in range(100000))
+
+    def get(session, url, **kwds):
+        assert kwds['stream']
+        response = requests.models.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(body)
+        return response
+    mocked_driver.command_executor.responses[Command.GET_ALL_COOKIES] = []
+    monkeypatch.setattr(requests.Session, 'get', get)
+
+    result = mocked_driver.download_url('http://example.com/export.csv', stream=True)
+    assert result.status_code == 200
+    result.save(str(tmpdir.join('export.csv')))
+    assert tmpdir.join('export.csv').read_binary() == body
+    assert result.size == len(body)
+    assert result.sha256 == hashlib.sha256(body).hexdigest()
+
+    result = mocked_driver.download_url('http://example.com/export.csv', stream=True)
+    lines = result.iter_lines(chunk_size=1000, decode_unicode=True)
+    assert next(lines) == 'line 0'
+    assert list(lines)[-1] == 'line 99999'
+    assert result.sha256 == hashlib.sha256(body).hexdigest()
+
+
+def test_download_by_stream_lines_split_between_chunks(mocked_driver, monkeypatch):
+    def get(session, url, **kwds):
+        response = requests.models.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(b'first\r\nsecond\rthird\n')
+        return response
+    mocked_driver.command_executor.responses[Command.GET_ALL_COOKIES] = []
+    monkeypatch.setattr(requests.Session, 'get', get)
+
+    result = mocked_driver.download_url('http://example.com/export.csv', stream=True)
+    # First chunk ends by \r and second one starts by \n.
+    assert list(result.iter_lines(chunk_size=6)) == [b'first', b'second', b'third']
+
+
+def test_download_by_stream_read_partially(mocked_driver, monkeypatch):
+    closed = []
+
+    def get(session, url, **kwds):
+        response = requests.models.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(b'line\n' * 100)
+        response.raw.release_conn = lambda: closed.append(True)
+        return response
+    mocked_driver.command_executor.responses[Command.GET_ALL_COOKIES] = []
+    monkeypatch.setattr(requests.Session, 'get', get)
+
+    with mocked_driver.download_url('http://example.com/export.csv', stream=True) as result:
+        assert next(result.iter_lines(chunk_size=10)) == b'line'
+        with pytest.raises(Exception) as excinfo:
+            result.size
+        assert 'partially' in str(excinfo.value)
+    assert closed == [True]
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def do_HEAD(self):
+        if self.path == '/no-head':
+            self._respond(405)
+        else:
+            self.do_GET()
+
+    def do_GET(self):
+        if self.path == '/asset':
+            if self.headers.get('If-None-Match') == '"v1"':
+                self._respond(304)
+            else:
+                self._respond(200, b'x' * 1000, {'ETag': '"v1"'})
+            return
+        self._respond(404 if self.path == '/missing' else 200)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._respond(200)
+
+    def _respond(self, status_code, body=b'', headers=None):
+        self.send_response(status_code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+        self.server.requests.append((self.command, self.path, self.headers.get('Cookie')))
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.yield_fixture
+def http_server():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+def test_check_links(mocked_driver, http_server):
+    url = 'http://127.0.0.1:{}'.format(http_server.server_address[1])
+    executor = mocked_driver.command_executor
+    executor.responses[Command.GET_ALL_COOKIES] = [{'name': 'session', 'value': 'abc', 'domain': '127.0.0.1'}]
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = [
+        url + '/ok', url + '/ok#fragment', url + '/missing', url + '/no-head', 'mailto:someone@example.com',
+    ]
+    report = mocked_driver.check_links(concurrency=4)
+    assert executor.count() == 2
+    assert report.status_codes == {url + '/ok': 200, url + '/missing': 404, url + '/no-head': 200}
+    assert [link.url for link in report.failed] == [url + '/missing']
+    assert [link.method for link in report] == ['head', 'get', 'get']
+    assert all(link.latency >= 0 for link in report)
+    assert not report
+    assert set(cookie for _, _, cookie in http_server.requests) == {'session=abc'}
+
+
+def test_check_links_sends_no_cookies_to_other_hosts(mocked_driver, http_server):
+    port = http_server.server_address[1]
+    executor = mocked_driver.command_executor
+    executor.responses[Command.GET_ALL_COOKIES] = [{'name': 'session', 'value': 'abc', 'domain': '127.0.0.1'}]
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = [
+        'http://127.0.0.1:{}/app'.format(port), 'http://localhost:{}/external'.format(port),
+    ]
+    assert mocked_driver.check_links()
+    assert sorted((path, cookie) for _, path, cookie in http_server.requests) == [
+        ('/app', 'session=abc'), ('/external', None),
+    ]
+
+
+def test_download_file_by_form_with_shadowing_controls(driver, http_server):
+    driver.execute_script('''
+        var form = document.createElement('form');
+        form.setAttribute('action', arguments[0]);
+        form.setAttribute('method', 'POST');
+        form.innerHTML = '<input type="hidden" name="action" value="export">' +
+            '<input type="hidden" name="method" value="csv">' +
+            '<input type="hidden" name="elements" value="all">' +
+            '<input type="button" id="btn-export" value="Export">';
+        document.body.appendChild(form);
+    ''', 'http://127.0.0.1:{}/export'.format(http_server.server_address[1]))
+    result = driver.get_elm('btn-export').download_file()
+    assert result.method == 'post'
+    assert [(command, path) for command, path, _ in http_server.requests] == [('POST', '/export')]
+
+
+def test_download_head_and_conditional(mocked_driver, http_server):
+    url = 'http://127.0.0.1:{}/asset'.format(http_server.server_address[1])
+    mocked_driver.command_executor.responses[Command.GET_ALL_COOKIES] = []
+
+    result = mocked_driver.download_url(url, method='head', conditional=True)
+    assert result.method == 'head'
+    assert result.headers['ETag'] == '"v1"'
+    assert result.data == ''
+
+    # Validators of HEAD are not used for GET which needs body.
+    result = mocked_driver.download_url(url, conditional=True)
+    assert result.status_code == 200
+    assert result.size == 1000
+    result = mocked_driver.download_url(url, conditional=True)
+    assert result.not_modified
+    assert result.size == 0
+    assert mocked_driver.download_url(url).status_code == 200
@@ -1,7 +1,9 @@
 import pytest
+from selenium.webdriver.remote.command import Command
 
 from webdriverwrapper.decorators import allowed_error_pages, allowed_any_error_message
 from webdriverwrapper.exceptions import ErrorPageException, ErrorMessagesException
+from webdriverwrapper.health import _page_health_scope
 
 
 @allowed_error_pages('403')
@@ -51,3 +53,33 @@ def test_check_errors_not_all_allowed_error_messages(driver_error_msgs):
 @allowed_any_error_message
 def test_check_errors_expected_and_allowed_error_messages(driver_error_msgs):
     driver_error_msgs.check_errors(expected_error_messages=('some-error',), allowed_error_messages=('another-error',))
+
+
+def test_probe_error_page_by_one_call(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.FIND_ELEMENTS] = []
+    assert mocked_driver.get_error_page() is None
+    assert mocked_driver.get_error_traceback() is None
+    assert executor.count() == executor.count(Command.FIND_ELEMENTS) == 2
+
+
+def test_check_errors_and_infos_by_one_call(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = {'error_messages': [], 'info_messages': [], 'js_errors': None, 'error_page': None}
+    with _page_health_scope(mocked_driver):
+        mocked_driver.check_errors()
+        mocked_driver.check_infos()
+    assert executor.count(Command.W3C_EXECUTE_SCRIPT) == 1
+    assert executor.count(Command.FIND_ELEMENTS, Command.GET_CURRENT_URL) == 0
+
+
+def test_check_errors_calls_customized_method(mocked_driver, monkeypatch):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = {'error_messages': [], 'js_errors': None, 'url': 'http://page'}
+    monkeypatch.setattr(mocked_driver, 'get_error_page', lambda: '500', raising=False)
+    with pytest.raises(ErrorPageException) as excinfo:
+        mocked_driver.check_errors()
+    assert excinfo.value.url == 'http://page'
+    script_args = [params['args'] for command, params in executor.commands if command == Command.W3C_EXECUTE_SCRIPT]
+    assert len(script_args) == 1
+    assert 'error_page' not in script_args[0][0]
@@ -1,10 +1,15 @@
 import pytest
+from selenium.webdriver.remote.command import Command
 
 from webdriverwrapper.exceptions import (
+    _BKTree,
+    _LazyExceptionMsg,
+    _SuggestionIndex,
     _create_exception_msg,
     _create_exception_msg_tag_element,
     _find_best_suggestion,
     NoSuchElementException,
+    WebDriverException,
 )
 
 
@@ -40,6 +45,41 @@ def test_make_msg_with_url():
     assert 'No element <* id=id> found at http://example.com' == _create_exception_msg(id_='id', url='http://example.com')
 
 
+def test_lazy_msg():
+    calls = []
+    msg = _LazyExceptionMsg(lambda: calls.append(1) or 'http://example.com', id_='id')
+    assert not calls
+    assert str(msg) == 'No element <* id=id> found at http://example.com'
+    assert 'id=id' in msg
+    assert len(calls) == 1
+
+
+def test_lazy_msg_with_failing_url():
+    def get_url():
+        raise WebDriverException('driver is gone')
+    assert str(_LazyExceptionMsg(get_url, id_='id')) == 'No element <* id=id> found'
+
+
+def test_lazy_msg_does_not_hide_bugs():
+    def get_url():
+        raise KeyError('bug')
+    with pytest.raises(KeyError):
+        str(_LazyExceptionMsg(get_url, id_='id'))
+
+
+def test_raises_exception_without_building_msg(mocked_driver):
+    def no_such_element(params):
+        raise NoSuchElementException('')
+    executor = mocked_driver.command_executor
+    executor.responses[Command.FIND_ELEMENT] = no_such_element
+    executor.responses[Command.GET_CURRENT_URL] = 'http://example.com'
+    with pytest.raises(NoSuchElementException) as excinfo:
+        mocked_driver.find_element_by_id('some_non_exists_id')
+    assert executor.count(Command.GET_CURRENT_URL) == 0
+    assert 'some_non_exists_id' in str(excinfo.value)
+    assert executor.count(Command.GET_CURRENT_URL) == 1
+
+
 def test_raises_exception_with_msg(driver):
     with pytest.raises(NoSuchElementException) as excinfo:
         driver.get_elm('some_non_exists_id')
@@ -61,3 +101,45 @@ def test_suggestions(driver):
 def test_find_best_suggestions():
     suggestion = _find_best_suggestion('idx', ['id', 'anotherid', 'someid'])
     assert suggestion == 'id'
+    assert _find_best_suggestion('btn', ['btn-default', 'button', 'btn']) == 'button'
+    assert _find_best_suggestion('btn', ['btn']) is None
+
+
+def test_suggestions_by_name(driver_form):
+    with pytest.raises(NoSuchElementException) as excinfo:
+        driver_form.get_elm(name='checkbox1')
+    assert 'did you mean name=checkbox_1?' in str(excinfo.value)
+
+
+def test_without_suggestions(driver):
+    with driver.without_suggestions():
+        with pytest.raises(NoSuchElementException) as excinfo:
+            driver.find_element_by_id('some_non_exists_id')
+        assert 'did you mean' not in str(excinfo.value)
+    assert driver.suggestions
+
+
+def test_suggestions_are_cached(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = lambda params: None if params['args'][0] else {
+        'version': 'v1', 'id': ['somepage'], 'class': [], 'name': [],
+    }
+    for _ in range(2):
+        with pytest.raises(NoSuchElementException) as excinfo:
+            mocked_driver.get_elm('somepag')
+        assert 'did you mean id=somepage?' in str(excinfo.value)
+    assert executor.commands[-1][1]['args'] == ['v1']
+
+
+def test_bk_tree_find_best():
+    tree = _BKTree(['id', 'anotherid', 'someid', 'btn', 'btn-default'])
+    assert tree.find_best('idx', 13) == 'id'
+    assert tree.find_best('btn-defautl', 21) == 'btn-default'
+    assert tree.find_best('someidd', 17) == 'someid'
+    assert tree.find_best('id', 2) is None
+
+
+def test_suggestion_index_builds_tree_on_first_use():
+    index = _SuggestionIndex({'version': 'v1', 'id': ['somepage'], 'class': ['someclass'], 'name': []})
+    assert index.find_best('id', 'somepag') == 'somepage'
+    assert list(index._trees) == ['id']
@@ -1,6 +1,8 @@
 import pytest
+from selenium.webdriver.remote.command import Command
 
 from webdriverwrapper.exceptions import NoSuchElementException
+from webdriverwrapper.forms import _CHECKED_SCRIPT, _FORM_SCHEMA_SCRIPT
 
 
 def test_fill_out(driver_form):
@@ -15,6 +17,43 @@ def test_fill_out(driver_form):
     })
 
 
+def test_fill_out_by_script(driver_form):
+    driver_form.get_elm('form').fill_out({
+        'text': 'text',
+        'textarea': 'text',
+        'checkbox_1': True,
+        'checkbox_2': False,
+        'hidden_checkbox_inside_label': True,
+        'radio': 'value2',
+        'select': 'value1',
+        'multiselect': ['value1', 'value2'],
+    }, by_script=True)
+    assert driver_form.get_elm(name='text').get_attribute('value') == 'text'
+    assert driver_form.get_elm(name='checkbox_1').is_selected()
+    assert driver_form.get_elm(name='hidden_checkbox_inside_label').is_selected()
+    assert driver_form.get_elm(xpath='//input[@name="radio"][@value="value2"]').is_selected()
+    assert [option.get_attribute('value') for option in driver_form.get_elm(name='multiselect').all_selected_options] == ['value1', 'value2']
+
+
+def test_fill_out_by_script_with_tracked_values(driver_form):
+    # Simulates value tracking of frameworks like React which overrides value on instance.
+    driver_form.execute_script('''
+        window.trackedValues = [];
+        ['text', 'textarea'].forEach(function (name) {
+            var elm = document.getElementsByName(name)[0];
+            var descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(elm), 'value');
+            Object.defineProperty(elm, 'value', {
+                get: function () { return descriptor.get.call(this); },
+                set: function (value) { window.trackedValues.push(value); descriptor.set.call(this, value); },
+            });
+        });
+    ''')
+    driver_form.get_elm('form').fill_out({'text': 'text', 'textarea': 'textarea'}, by_script=True)
+    assert driver_form.execute_script('return window.trackedValues') == []
+    assert driver_form.get_elm(name='text').get_attribute('value') == 'text'
+    assert driver_form.get_elm(name='textarea').get_attribute('value') == 'textarea'
+
+
 def test_nosuchelement(driver_form):
     with pytest.raises(NoSuchElementException) as excinfo:
         driver_form.get_elm('form').fill_out({
@@ -42,3 +81,77 @@ def test_unicode(driver_form):
     driver_form.get_elm('form').fill_out({
         'text': u'ěřžčřž',
     })
+
+
+def _control(element_id, tag_name='input', type_='text', value=None, multiple=False, options=None):
+    return {
+        'element': {'ELEMENT': element_id},
+        'tag_name': tag_name,
+        'type': type_,
+        'value': value,
+        'multiple': multiple,
+        'options': options,
+    }
+
+
+@pytest.fixture
+def mocked_form(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.FIND_ELEMENTS] = [{'ELEMENT': 'form'}]
+    executor.responses[Command.GET_ELEMENT_TAG_NAME] = 'form'
+    form = mocked_driver.get_elm(tag_name='form')
+    del executor.commands[:]
+
+    def make_form(schema, execute_script=lambda params: []):
+        executor.responses[Command.W3C_EXECUTE_SCRIPT] = lambda params: (
+            schema if params['script'] == _FORM_SCHEMA_SCRIPT else execute_script(params)
+        )
+        return form
+    return make_form
+
+
+def test_fill_out_analyzes_form_by_one_call(mocked_form):
+    data = dict(('field{}'.format(index), 'value') for index in range(60))
+    form = mocked_form(dict((name, [_control(name)]) for name in data))
+    executor = form.parent.command_executor
+    form.fill_out(data)
+    assert executor.count(Command.W3C_EXECUTE_SCRIPT) == 1
+    assert executor.count(Command.FIND_ELEMENTS, Command.GET_ELEMENT_ATTRIBUTE, Command.GET_ELEMENT_TAG_NAME) == 0
+    assert executor.count(Command.SEND_KEYS_TO_ELEMENT) == 2 * 60
+
+
+def test_fill_out_by_script_by_one_call(mocked_form):
+    data = dict(('field{}'.format(index), 'value') for index in range(60))
+    form = mocked_form(dict((name, [_control(name)]) for name in data))
+    executor = form.parent.command_executor
+    form.fill_out(data, by_script=True, typed_fields=('field0',))
+    assert executor.count(Command.W3C_EXECUTE_SCRIPT) == 2
+    assert executor.count(Command.SEND_KEYS_TO_ELEMENT) == 2
+
+
+def test_fill_out_multiple_values_by_one_call(mocked_form):
+    form = mocked_form({
+        'multiselect': [_control(
+            'multiselect', tag_name='select', type_='select-multiple', multiple=True,
+            options=['value{}'.format(index) for index in range(500)],
+        )],
+        'checkboxes': [
+            _control('checkbox{}'.format(index), type_='checkbox', value='value{}'.format(index))
+            for index in range(10)
+        ],
+    }, lambda params: [index % 2 == 0 for index in range(5)] if params['script'] == _CHECKED_SCRIPT else [])
+    executor = form.parent.command_executor
+    form.fill_out({
+        'multiselect': ['value{}'.format(index) for index in range(250)],
+        'checkboxes': ['value{}'.format(index) for index in range(5)],
+    })
+    assert executor.count(Command.W3C_EXECUTE_SCRIPT) == 3
+    assert executor.count(Command.CLICK_ELEMENT) == 2
+
+
+def test_fill_out_analyzes_changed_form_again(mocked_form):
+    form = mocked_form({'field': [_control('field')]})
+    executor = form.parent.command_executor
+    form.fill_out({'field': 'value'})
+    form.fill_out({'field': 'value'})
+    assert executor.count(Command.W3C_EXECUTE_SCRIPT) == 2
@@ -0,0 +1,56 @@
+from webdriverwrapper.locators import _compile_locator, _xpath_literal, _css_string
+
+
+def test_compile_id():
+    assert _compile_locator(id_='id') == ('css selector', '[id="id"]')
+
+
+def test_compile_class_name():
+    assert _compile_locator(class_name='cls') == ('css selector', '[class~="cls"]')
+
+
+def test_compile_text():
+    assert _compile_locator(text=42) == (
+        'xpath',
+        './/*/text()[contains(., "42") and not(ancestor-or-self::*[@data-selenium-not-search])]/..',
+    )
+
+
+def test_compile_xpath_and_css_selector():
+    assert _compile_locator(xpath='//a') == ('xpath', '//a')
+    assert _compile_locator(css_selector='a.b') == ('css selector', 'a.b')
+
+
+def test_compile_in_parent():
+    assert _compile_locator(name='name', parent_id='id') == ('xpath', '(.//*[@id="id"])[1]//*[@name="name"]')
+
+
+def test_compile_class_name_in_parent():
+    assert _compile_locator(tag_name='p', parent_class_name='cls') == (
+        'xpath',
+        '(.//*[contains(concat(" ", normalize-space(@class), " "), " cls ")])[1]//p',
+    )
+
+
+def test_compile_text_in_parent():
+    assert _compile_locator(text='text', parent_tag_name='body') == (
+        'xpath',
+        '(.//body)[1]//*/text()[contains(., "text") and not(ancestor-or-self::*[@data-selenium-not-search])]/..',
+    )
+
+
+def test_not_compiled():
+    assert _compile_locator(xpath='.//a', parent_id='id') is None
+    assert _compile_locator(class_name='two classes', parent_id='id') is None
+    assert _compile_locator(parent_id='id') is None
+    assert _compile_locator(text=['a']) is None
+
+
+def test_xpath_literal():
+    assert _xpath_literal('a') == '"a"'
+    assert _xpath_literal('"a"') == '\'"a"\''
+    assert _xpath_literal('"a\'') == 'concat("", \'"\', "a\'")'
+
+
+def test_css_string():
+    assert _css_string('a"b\\') == '"a\\"b\\\\"'
@@ -1,7 +1,12 @@
+import time
+
 import pytest
+from selenium.common.exceptions import NoAlertPresentException
+from selenium.webdriver.remote.command import Command
 
-from webdriverwrapper.exceptions import NoSuchElementException, TimeoutException
-from webdriverwrapper.wrapper import _WebElementWrapper
+from webdriverwrapper.exceptions import NoSuchElementException, TimeoutException, UnexpectedAlertPresentException
+from webdriverwrapper.forms import Form
+from webdriverwrapper.wrapper import _FORGET_ELEMENTS_SCRIPT, _WebElementWrapper, _SelectWrapper
 
 
 def test_returns_wrapped_element(driver):
@@ -9,6 +14,11 @@ def test_returns_wrapped_element(driver):
     assert isinstance(elm, _WebElementWrapper)
 
 
+def test_returns_wrapped_elements_by_tag_name(driver_form):
+    elms = driver_form.get_elms(xpath='//form | //select | //textarea')
+    assert [type(elm) for elm in elms] == [Form, _WebElementWrapper, _SelectWrapper, _SelectWrapper]
+
+
 def test_find_elements_by_integer(driver):
     elms = driver.get_elms(text=42)
     assert len(elms) == 1
@@ -32,6 +42,31 @@ def test_find_elements_selenium_not_search(driver):
     assert len(elms) == 2
 
 
+def test_find_elements_in_parent(driver):
+    elms = driver.get_elms(parent_tag_name='body', tag_name='p')
+    assert len(elms) == 6
+
+
+def test_find_elements_by_text_in_parent(driver):
+    elms = driver.get_elms(parent_tag_name='body', text='text')
+    assert len(elms) == 2
+
+
+def test_find_elements_in_not_existing_parent(driver):
+    assert driver.get_elms(parent_id='nosuchparent', tag_name='p') == []
+
+
+def test_find_elements_by_xpath_in_not_existing_parent(driver):
+    assert driver.get_elms(parent_id='nosuchparent', xpath='.//p') == []
+
+
+def test_find_elements_by_css_selector_in_not_existing_parent(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.FIND_ELEMENTS] = []
+    assert mocked_driver.get_elms(parent_id='nosuchparent', css_selector='p') == []
+    assert executor.count() == executor.count(Command.FIND_ELEMENTS) == 1
+
+
 def test_contains_text(driver):
     assert driver.contains_text('text')
 
@@ -49,6 +84,115 @@ def test_wait_for_element(driver):
     assert driver.wait_for_element(timeout=0.5, id_='somepage')
 
 
+def test_wait_for_element_added_later(driver):
+    driver.execute_script('''
+        setTimeout(function () {
+            var elm = document.createElement('div');
+            elm.id = 'addedlater';
+            document.body.appendChild(elm);
+        }, 200);
+    ''')
+    assert driver.wait_for_element(timeout=2, id_='addedlater')
+
+
+def test_wait_for_element_show_fading_in(driver):
+    driver.execute_script('''
+        var elm = document.createElement('div');
+        elm.id = 'fadingin';
+        elm.textContent = 'fading in';
+        elm.style.opacity = '0';
+        elm.style.transition = 'opacity 0.3s';
+        document.body.appendChild(elm);
+        setTimeout(function () {
+            elm.style.opacity = '1';
+        }, 100);
+    ''')
+    assert driver.wait_for_element_show(timeout=2, id_='fadingin')
+
+
+def test_wait_for_element_by_polling(driver):
+    driver.use_mutation_observer = False
+    try:
+        assert driver.wait_for_element(timeout=0.5, id_='somepage')
+    finally:
+        del driver.use_mutation_observer
+
+
+def test_wait_for_element_by_mutation_observer(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT_ASYNC] = [{'ELEMENT': 'elm'}]
+    executor.responses[Command.GET_ELEMENT_TAG_NAME] = 'div'
+    executor.responses[Command.FIND_ELEMENTS] = [{'ELEMENT': 'elm'}]
+    assert mocked_driver.wait_for_element(timeout=0.5, id_='elm')
+    assert executor.count(Command.W3C_EXECUTE_SCRIPT_ASYNC) == 1
+
+
+def test_wait_for_element_makes_one_lookup(mocked_driver):
+    mocked_driver.use_mutation_observer = False
+    executor = mocked_driver.command_executor
+    executor.responses[Command.GET_ELEMENT_TAG_NAME] = 'div'
+    executor.responses[Command.FIND_ELEMENTS] = [{'ELEMENT': 'elm'}]
+    elm = mocked_driver.wait_for_element(timeout=0.5, message='not found', id_='elm')
+    assert elm.id == 'elm'
+    assert executor.count(Command.FIND_ELEMENTS) == 1
+
+
+def test_wait_for_element_show_returns_visible_element(mocked_driver):
+    mocked_driver.use_mutation_observer = False
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = lambda params: (
+        ['div', 'div'] if 'tagName' in params['script'][:100] else [False, True]
+    )
+    executor.responses[Command.FIND_ELEMENTS] = [{'ELEMENT': 'hidden'}, {'ELEMENT': 'visible'}]
+    elm = mocked_driver.wait_for_element_show(timeout=0.5, message='not found', class_name='elm')
+    assert elm.id == 'visible'
+    assert executor.count(Command.FIND_ELEMENTS) == 1
+    # One call for tag names and one for visibility of all elements.
+    assert executor.count(Command.W3C_EXECUTE_SCRIPT) == 2
+
+
+def test_wait_for_element_fallback_to_polling(mocked_driver):
+    def script_timeout(params):
+        raise TimeoutException('script timeout')
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT_ASYNC] = script_timeout
+    executor.responses[Command.GET_ELEMENT_TAG_NAME] = 'div'
+    executor.responses[Command.FIND_ELEMENTS] = [{'ELEMENT': 'elm'}]
+    assert mocked_driver.wait_for_element(timeout=0.5, id_='elm')
+    assert mocked_driver.wait_for_element(timeout=0.5, id_='elm')
+    assert executor.count(Command.W3C_EXECUTE_SCRIPT_ASYNC) == 1
+
+
+def test_wait_for_element_polls_when_not_found_in_browser(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT_ASYNC] = None
+    executor.responses[Command.GET_ELEMENT_TAG_NAME] = 'div'
+    executor.responses[Command.FIND_ELEMENTS] = [{'ELEMENT': 'elm'}]
+    assert mocked_driver.wait_for_element(timeout=2, id_='elm')
+    assert executor.count(Command.FIND_ELEMENTS) == 1
+
+
+def test_wait_for_element_does_not_poll_after_timeout_in_browser(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT_ASYNC] = lambda params: time.sleep(params['args'][4] / 1000)
+    start = time.time()
+    with pytest.raises(TimeoutException):
+        mocked_driver.wait_for_element(timeout=0.2, id_='elm')
+    # Polling would sleep for another half a second.
+    assert time.time() - start < 0.5
+
+
+def test_wait_for_element_on_element_without_mutation_observer(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.GET_ELEMENT_TAG_NAME] = 'div'
+    executor.responses[Command.FIND_ELEMENTS] = [{'ELEMENT': 'parent'}]
+    executor.responses[Command.FIND_CHILD_ELEMENTS] = [{'ELEMENT': 'child'}]
+    parent = mocked_driver.get_elm(id_='parent')
+    mocked_driver.use_mutation_observer = False
+    assert parent.wait_for_element(timeout=0.5, id_='child').id == 'child'
+    assert executor.count(Command.W3C_EXECUTE_SCRIPT_ASYNC) == 0
+
+
 def test_wait_for_element_on_element(driver):
     with pytest.raises(TimeoutException):
         assert driver.get_elm(id_='somepage').wait_for_element(timeout=0.5, tag_name='p')
@@ -59,6 +203,11 @@ def test_wait_for_element_fail(driver):
         driver.wait_for_element(timeout=0.5, id_='nosuchelement', parent_tag_name='body')
 
 
+def test_get_displayed_elms(driver):
+    driver.execute_script('document.getElementsByTagName("p")[0].style.display = "none"')
+    assert len(driver.get_displayed_elms(tag_name='p')) == len(driver.get_elms(tag_name='p')) - 1
+
+
 def test_wait_for_element_hide(driver):
     driver.wait_for_element_hide(timeout=0.5, id_='nosuchelement')
 
@@ -66,3 +215,275 @@ def test_wait_for_element_hide(driver):
 def test_wait_for_element_hide_fail(driver):
     with pytest.raises(TimeoutException) as excinfo:
         driver.wait_for_element_hide(timeout=0.5, id_='somepage', parent_tag_name='body')
+
+
+def test_tracked_alerts_are_not_closed_when_not_pending(mocked_driver):
+    mocked_driver.track_alerts = True
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = {'error_messages': [], 'info_messages': [], 'js_errors': None, 'error_page': None}
+    mocked_driver.check_errors()
+    assert executor.count(Command.W3C_ACCEPT_ALERT) == 0
+    assert executor.count() == 1
+
+
+def test_tracked_alert_is_closed_when_it_blocks(mocked_driver):
+    mocked_driver.track_alerts = True
+    executor = mocked_driver.command_executor
+    responses = [
+        UnexpectedAlertPresentException('alert'),
+        {'error_messages': [], 'info_messages': [], 'js_errors': None, 'error_page': None},
+    ]
+
+    def execute_script(params):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = execute_script
+    mocked_driver.check_errors()
+    assert executor.count(Command.W3C_ACCEPT_ALERT) == 1
+    assert executor.count(Command.W3C_EXECUTE_SCRIPT) == 2
+    assert not mocked_driver._alert_pending
+
+
+def test_tracked_alert_already_dismissed_by_browser(mocked_driver):
+    mocked_driver.track_alerts = True
+    executor = mocked_driver.command_executor
+    responses = [
+        UnexpectedAlertPresentException('alert'),
+        {'error_messages': [], 'info_messages': [], 'js_errors': None, 'error_page': None},
+    ]
+
+    def execute_script(params):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def accept_alert(params):
+        raise NoAlertPresentException('no alert')
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = execute_script
+    executor.responses[Command.W3C_ACCEPT_ALERT] = accept_alert
+    mocked_driver.check_errors()
+    assert executor.count(Command.W3C_ACCEPT_ALERT) == 1
+    assert executor.count(Command.W3C_EXECUTE_SCRIPT) == 2
+    assert not mocked_driver._alert_pending
+
+
+def test_wait_for_tracked_alert(mocked_driver):
+    mocked_driver.track_alerts = True
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT_ASYNC] = True
+    mocked_driver.wait_for_alert(timeout=1)
+    assert executor.count() == executor.count(Command.W3C_EXECUTE_SCRIPT_ASYNC) == 1
+    assert mocked_driver._alert_pending
+    mocked_driver.close_alert(ignore_exception=True)
+    assert executor.count(Command.W3C_ACCEPT_ALERT) == 1
+
+
+def test_wait_for_tracked_alert_by_slices(mocked_driver):
+    mocked_driver.track_alerts = True
+    executor = mocked_driver.command_executor
+    responses = [None, None, True]
+    executor.responses[Command.W3C_EXECUTE_SCRIPT_ASYNC] = lambda params: responses.pop(0)
+    mocked_driver.wait_for_alert(timeout=60)
+    assert [params['args'][0] for _, params in executor.commands] == [5000, 5000, 5000]
+
+
+def test_wait_for_tracked_alert_with_short_script_timeout(mocked_driver):
+    def script_timeout(params):
+        raise TimeoutException('script timeout')
+    mocked_driver.track_alerts = True
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT_ASYNC] = script_timeout
+    executor.responses[Command.W3C_GET_ALERT_TEXT] = 'alert'
+    mocked_driver.wait_for_alert(timeout=60)
+    # Waiting in browser is not turned off by one failure, only shorter slices are used.
+    assert mocked_driver._async_scripts_supported
+    assert mocked_driver._mutation_observer_slice == 2.5
+    assert executor.count(Command.W3C_GET_ALERT_TEXT) == 1
+
+
+@pytest.fixture
+def mocked_windows(mocked_driver):
+    executor = mocked_driver.command_executor
+    titles = {'a': 'A', 'b': 'B', 'c': 'C'}
+    current = ['a']
+
+    def switch(params):
+        current[0] = params['handle']
+    executor.responses[Command.W3C_GET_WINDOW_HANDLES] = lambda params: sorted(titles)
+    executor.responses[Command.W3C_GET_CURRENT_WINDOW_HANDLE] = lambda params: current[0]
+    executor.responses[Command.SWITCH_TO_WINDOW] = switch
+    executor.responses[Command.GET_TITLE] = lambda params: titles[current[0]]
+    return mocked_driver
+
+
+def test_switch_to_window_checks_known_window_first(mocked_windows):
+    executor = mocked_windows.command_executor
+    mocked_windows.switch_to_window(title='C')
+    mocked_windows.switch_to_window(title='A')
+    del executor.commands[:]
+    mocked_windows.switch_to_window(title='B')
+    assert executor.count(Command.SWITCH_TO_WINDOW) == 1
+    assert executor.count(Command.GET_TITLE) == 1
+    assert mocked_windows.title == 'B'
+
+
+def test_close_other_windows_without_other_windows(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_GET_WINDOW_HANDLES] = ['a']
+    mocked_driver.close_other_windows()
+    assert executor.count() == 1
+
+
+def test_go_to_relative_path_after_get(mocked_driver):
+    executor = mocked_driver.command_executor
+    mocked_driver.get('http://example.com/some/page')
+    mocked_driver.go_to('/another', {'a': 1})
+    assert executor.count(Command.GET_CURRENT_URL) == 0
+    assert executor.commands[-1][1]['url'] == 'http://example.com/another?a=1'
+
+
+def test_go_to_relative_path_with_base_url(mocked_driver):
+    executor = mocked_driver.command_executor
+    current_url = ['data:,']
+    executor.responses[Command.GET_CURRENT_URL] = lambda params: current_url[0]
+    mocked_driver.base_url = 'http://example.com'
+    assert mocked_driver.get_url('/another') == 'http://example.com/another'
+    current_url[0] = 'http://redirected.com/page'
+    assert mocked_driver.get_url('/another') == 'http://redirected.com/another'
+    assert executor.count(Command.GET_CURRENT_URL) == 2
+
+
+def test_go_to_relative_path_after_get_with_base_url(mocked_driver):
+    executor = mocked_driver.command_executor
+    mocked_driver.base_url = 'http://example.com'
+    mocked_driver.get('http://other-app.com/some/page')
+    mocked_driver.go_to('/another')
+    assert executor.commands[-1][1]['url'] == 'http://other-app.com/another'
+    assert executor.count(Command.GET_CURRENT_URL) == 0
+
+
+@pytest.mark.parametrize('navigate', [
+    lambda driver: driver.back(),
+    lambda driver: driver.forward(),
+    lambda driver: driver.refresh(),
+    lambda driver: driver.execute_script('location.href = "http://third-app.com/"'),
+])
+def test_go_to_relative_path_after_navigation(mocked_driver, navigate):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.GET_CURRENT_URL] = 'http://third-app.com/page'
+    mocked_driver.get('http://other-app.com/some/page')
+    mocked_driver.find_elements_by_tag_name('a')
+    navigate(mocked_driver)
+    mocked_driver.go_to('/another')
+    assert executor.commands[-1][1]['url'] == 'http://third-app.com/another'
+
+
+def test_extract_by_one_call(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = [['Home', '/'], ['About', '/about']]
+    assert mocked_driver.extract(('text', '@href'), tag_name='a') == [
+        {'text': 'Home', '@href': '/'},
+        {'text': 'About', '@href': '/about'},
+    ]
+    assert executor.count() == 1
+    assert executor.commands[0][1]['args'][:2] == ['css selector', 'a']
+
+
+def test_get_texts_and_attributes(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = lambda params: [['value'] for _ in range(3)]
+    assert mocked_driver.get_texts(class_name='cell') == ['value'] * 3
+    assert mocked_driver.get_attributes('title', class_name='cell') == ['value'] * 3
+    assert executor.commands[-1][1]['args'][-1] == ['@title']
+    assert executor.count() == 2
+
+
+@pytest.fixture
+def mocked_table(mocked_driver):
+    executor = mocked_driver.command_executor
+    executor.responses[Command.FIND_ELEMENTS] = [{'ELEMENT': 'table'}]
+    executor.responses[Command.GET_ELEMENT_TAG_NAME] = 'table'
+    table = mocked_driver.get_elm(tag_name='table')
+    rows = [['name', 'value']] + [['row{}'.format(index), str(index)] for index in range(25)]
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = lambda params: rows[params['args'][1]:params['args'][2]]
+    del executor.commands[:]
+    return table
+
+
+def test_extract_table(mocked_table):
+    rows = mocked_table.extract_table()
+    assert len(rows) == 25
+    assert rows[0] == {'name': 'row0', 'value': '0'}
+    assert mocked_table._driver.command_executor.count() == 1
+
+
+def test_iter_table_by_chunks(mocked_table):
+    rows = list(mocked_table.iter_table(chunk_size=10))
+    assert rows == mocked_table.extract_table()
+    assert mocked_table._driver.command_executor.count(Command.W3C_EXECUTE_SCRIPT) == 3 + 1
+    assert list(mocked_table.iter_table(header=False, chunk_size=13))[0] == ['name', 'value']
+
+
+def test_extract_table_with_grouped_header(mocked_table):
+    rows = [['name', 'price', 'price'], ['', 'net', 'gross'], ['row', '1', '2', 'note']]
+    mocked_table._driver.command_executor.responses[Command.W3C_EXECUTE_SCRIPT] = rows
+    assert mocked_table.extract_table() == [
+        {'name': '', 'price': 'net', 'price_2': 'gross'},
+        {'name': 'row', 'price': '1', 'price_2': '2', 3: 'note'},
+    ]
+
+
+def test_extract_table_with_spans(driver, tmpdir):
+    html = tmpdir.join('table.html')
+    html.write(
+        '<table>'
+        '<tr><th rowspan="2">name</th><th colspan="2">price</th></tr>'
+        '<tr><th>net</th><th>gross</th></tr>'
+        '<tr><td>row</td><td>1</td><td>2</td><td>note</td></tr>'
+        '</table>'
+    )
+    driver.get('file://{}'.format(html))
+    assert driver.get_elm(tag_name='table').extract_table() == [
+        {'name': 'name', 'price': 'net', 'price_2': 'gross'},
+        {'name': 'row', 'price': '1', 'price_2': '2', 3: 'note'},
+    ]
+
+
+def test_iter_elms_by_chunks(mocked_driver):
+    executor = mocked_driver.command_executor
+    elements = [{'ELEMENT': str(index)} for index in range(250)]
+    stored = {}
+
+    def chunk(params):
+        _, _, _, token, start, end = params['args']
+        if token is None:
+            stored['token'] = list(elements)
+            token = 'token'
+        if end >= len(stored[token]):
+            del stored[token]
+            token = None
+        chunk_elements = elements[start:end]
+        return [token, chunk_elements, ['tr'] * len(chunk_elements)]
+    executor.responses[Command.W3C_EXECUTE_SCRIPT] = lambda params: (
+        stored.pop(params['args'][0]) if params['script'] == _FORGET_ELEMENTS_SCRIPT else chunk(params)
+    )
+    elms = list(mocked_driver.iter_elms(tag_name='tr'))
+    assert len(elms) == 250
+    assert all(isinstance(elm, _WebElementWrapper) for elm in elms)
+    assert executor.count() == 3
+    assert not stored
+
+    del executor.commands[:]
+    assert len(list(mocked_driver.iter_elms(tag_name='tr', chunk_size=125))) == 250
+    assert executor.count() == 2
+
+    del executor.commands[:]
+    for index, elm in enumerate(mocked_driver.iter_elms(tag_name='tr', chunk_size=10)):
+        if index == 15:
+            break
+    # Two chunks and forgetting of found elements kept in page.
+    assert executor.count() == 3
+    assert not stored
@@ -1,21 +1,112 @@
 # pylint: disable=attribute-defined-outside-init,protected-access
 
+import collections
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urldefrag, urlencode, urlparse
+
 import requests
+from requests.adapters import HTTPAdapter
 
 __all__ = ('DownloadUrl', 'DownloadFile')
 
+#  Every driver has one session for all downloads, so connections are reused.
+#+ Links and exports are usually checked against one or few hosts.
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 16
+
+_CHUNK_SIZE = 64 * 1024
+
+#  Returns link of element or form of element (element itself, its ancestor
+#+ or descendant) with data serialized the same way as browser submits them
+#+ (pairs in tree order, controls disabled also by fieldset are skipped).
+#+ Form is read by attributes and getters of prototype, because properties
+#+ like ``form.action`` return control when form has ``<input name="action">``.
+_DOWNLOAD_INFO_SCRIPT = '''
+var elm = arguments[0];
+var href = typeof elm.href === 'string' ? elm.href : elm.getAttribute('href');
+var form = null;
+for (var ancestor = elm; ancestor && !form; ancestor = ancestor.parentElement) {
+    if (ancestor.tagName.toLowerCase() === 'form') {
+        form = ancestor;
+    }
+}
+form = form || elm.querySelector('form');
+if (!form) {
+    return {href: href, form: null};
+}
+var action = form.getAttribute('action');
+action = action ? new URL(action, document.baseURI).href : document.URL;
+var method = (form.getAttribute('method') || 'get').toLowerCase() === 'post' ? 'post' : 'get';
+var elements = Object.getOwnPropertyDescriptor(HTMLFormElement.prototype, 'elements').get.call(form);
+var data = [];
+Array.prototype.forEach.call(elements, function (control) {
+    var type = (control.type || '').toLowerCase();
+    var tagName = control.tagName.toLowerCase();
+    if (!control.name || control.matches(':disabled') || ['fieldset', 'object', 'output'].indexOf(tagName) !== -1) {
+        return;
+    }
+    if (['button', 'reset', 'file'].indexOf(type) !== -1) {
+        return;
+    }
+    if ((type === 'submit' || type === 'image') && control !== elm) {
+        return;
+    }
+    if ((type === 'checkbox' || type === 'radio') && !control.checked) {
+        return;
+    }
+    if (tagName === 'select') {
+        Array.prototype.forEach.call(control.options, function (option) {
+            if (option.selected && !option.disabled) {
+                data.push([control.name, option.value]);
+            }
+        });
+        return;
+    }
+    data.push([control.name, control.value]);
+});
+return {href: href, form: {action: action, method: method, data: data}};
+'''
+
+
+#  Absolute URLs of all links in element (or whole page).
+_COLLECT_LINKS_SCRIPT = '''
+var root = arguments[0] || document;
+return Array.prototype.map.call(root.querySelectorAll('a[href]'), function (elm) {
+    return elm.href;
+});
+'''
+
 
 class _Download:
     """
     Object returned by calling
     :py:meth:`~webdriverwrapper.wrapper._WebdriverWrapper.download_url` or
     :py:meth:`~webdriverwrapper.wrapper._WebElementWrapper.download_file`.
+
+    With ``stream`` only headers are read when it's created, body is read
+    from network by chunks when it's needed. See :py:meth:`.iter_content`.
+    Streamed response keeps connection until whole body is read, so when you
+    don't read it all, call :py:meth:`.close` or use it as context manager:
+
+    .. code-block:: python
+
+        with driver.download_url(url, stream=True) as result:
+            first_line = next(result.iter_lines())
+
+    With ``method='head'`` only status and headers are downloaded (form with
+    method ``post`` can't be downloaded this way, it raises exception). With
+    ``conditional`` ``ETag`` and ``Last-Modified`` of response are kept (by
+    method and URL for the driver) and sent in ``If-None-Match`` and
+    ``If-Modified-Since`` next time, so unchanged file costs only ``304``
+    response (see :py:attr:`.not_modified`).
     """
 
     @property
     def method(self):
         """
-        Used method of request. ``GET`` or ``POST``.
+        Used method of request. ``GET``, ``POST`` or ``HEAD``.
         """
         return self._response.request.method.lower()
 
@@ -26,6 +117,16 @@ class _Download:
         """
         return self._response.status_code
 
+    @property
+    def not_modified(self):
+        """
+        ``True`` when download was ``conditional`` and response is
+        ``304 Not Modified``, so there is no body.
+
+        .. versionadded:: 2.9
+        """
+        return self._response.status_code == 304
+
     @property
     def encoding(self):
         """
@@ -46,26 +147,250 @@ class _Download:
     def data(self):
         """
         RAW data of response.
+
+        With ``stream`` it loads whole body to memory, use
+        :py:meth:`.iter_content`, :py:meth:`.iter_lines` or :py:meth:`.save`
+        instead.
         """
         return self._response.text
 
+    @property
+    def size(self):
+        """
+        Size of body in bytes. It's computed while body is read, so with
+        ``stream`` it reads (and throws away) body when it's not read yet.
+        When streamed body was read only partially, it raises exception.
+
+        .. versionadded:: 2.9
+        """
+        if self._size is None:
+            self._consume()
+        return self._size
+
+    @property
+    def sha256(self):
+        """
+        SHA-256 hex digest of body. It's computed the same way as
+        :py:attr:`.size`.
+
+        .. versionadded:: 2.9
+        """
+        if self._sha256 is None:
+            self._consume()
+        return self._sha256
+
+    def iter_content(self, chunk_size=_CHUNK_SIZE):
+        """
+        Generator of chunks of body (bytes). With ``stream`` body is read from
+        network by chunks, so it can be read only once and only one chunk is
+        in memory. :py:attr:`.size` and :py:attr:`.sha256` are computed while
+        reading.
+
+        .. versionadded:: 2.9
+        """
+        self._reading_started = True
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in self._response.iter_content(chunk_size):
+            digest.update(chunk)
+            size += len(chunk)
+            yield chunk
+        self._size = size
+        self._sha256 = digest.hexdigest()
+
+    def iter_lines(self, chunk_size=_CHUNK_SIZE, decode_unicode=False):
+        """
+        Generator of lines of body read by :py:meth:`.iter_content`. Lines are
+        bytes or strings decoded by :py:attr:`.encoding` with ``decode_unicode``.
+
+        .. versionadded:: 2.9
+        """
+        pending = b''
+        for chunk in self.iter_content(chunk_size):
+            lines = (pending + chunk).splitlines(True)
+            #  Last line is kept for next chunk also when it ends by \r,
+            #+ because next chunk can start by \n of the same line ending.
+            pending = lines.pop() if lines and not lines[-1].endswith(b'\n') else b''
+            for line in lines:
+                yield self._make_line(line, decode_unicode)
+        if pending:
+            yield self._make_line(pending, decode_unicode)
+
+    def _make_line(self, line, decode_unicode):
+        line = line.rstrip(b'\r\n')
+        if decode_unicode:
+            return line.decode(self.encoding or 'utf-8', 'replace')
+        return line
+
+    def save(self, target, chunk_size=_CHUNK_SIZE):
+        """
+        Writes body to ``target`` which is path or any writable binary file
+        object (opened file, :py:class:`io.BytesIO`, :py:class:`mmap.mmap`, ...)
+        by chunks. Returns ``target``.
+
+        .. versionadded:: 2.9
+        """
+        if hasattr(target, 'write'):
+            for chunk in self.iter_content(chunk_size):
+                target.write(chunk)
+        else:
+            with open(target, 'wb') as output:
+                for chunk in self.iter_content(chunk_size):
+                    output.write(chunk)
+        return target
+
+    def close(self):
+        """
+        Releases connection of streamed response back to the pool. It's not
+        needed when whole body is read.
+
+        .. versionadded:: 2.9
+        """
+        self._response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _consume(self):
+        if self._stream and self._reading_started:
+            raise Exception('Streamed body was read only partially, it can not be read again.')
+        for _ in self.iter_content():
+            pass
+
     def _make_request(self):
+        if self._method not in (None, 'head'):
+            raise Exception('Only method head can be forced, not {}.'.format(self._method))
         is_post, url, data = self._get_url_and_data()
-        cookies = self._get_cookies()
+        if is_post and self._method == 'head':
+            raise Exception('Method head can not be forced for form with method post.')
+        session = _get_session(self._driver)
+        self._size = None
+        self._sha256 = None
+        self._reading_started = False
 
         if is_post:
-            self._response = requests.post(url, data=data, cookies=cookies)
+            self._response = session.post(url, data=data, stream=self._stream)
+            return
+
+        #  Validators are kept by method too, otherwise HEAD would make next
+        #+ GET of the same URL end by 304 without any body to use.
+        cache_key = (self._method or 'get', url, urlencode(data) if data else '')
+        headers = _get_conditional_headers(session, cache_key) if self._conditional else None
+        if self._method == 'head':
+            self._response = session.head(url, params=data, headers=headers, allow_redirects=True)
         else:
-            self._response = requests.get(url, params=data, cookies=cookies)
+            self._response = session.get(url, params=data, headers=headers, stream=self._stream)
+        if self._conditional:
+            _store_conditional_headers(session, cache_key, self._response)
 
-    def _get_cookies(self):
-        all_cookies = self._driver.get_cookies()
-        return dict((cookie['name'], cookie['value']) for cookie in all_cookies)
+
+def _get_session(driver):
+    """
+    Returns :py:class:`requests.Session` of ``driver`` with cookies synced
+    from browser. Session is created on first download and kept on driver,
+    cookies are only updated by changes. Cookies keep their domain and path,
+    so they are never sent to other sites (host-only cookies are sent also
+    to subdomains of their host, see :py:func:`_make_cookie`).
+    """
+    session = getattr(driver, '_download_session', None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.synced_cookies = {}
+        session.conditional_cache = {}
+        driver._download_session = session
+
+    cookies = dict((_get_cookie_key(cookie), cookie) for cookie in driver.get_cookies())
+    for key in set(session.synced_cookies) - set(cookies):
+        name, domain, path = key
+        try:
+            session.cookies.clear(domain, path, name)
+        except KeyError:
+            # Already replaced or removed by response of some download.
+            pass
+    for key, cookie in cookies.items():
+        if session.synced_cookies.get(key) != cookie:
+            session.cookies.set_cookie(_make_cookie(cookie))
+    session.synced_cookies = cookies
+    return session
+
+
+def _get_cookie_key(cookie):
+    return cookie['name'], _get_cookie_domain(cookie), cookie.get('path') or '/'
+
+
+def _get_cookie_domain(cookie):
+    domain = cookie['domain']
+    #  Cookie jar looks for cookies of hosts without dot (like ``localhost``)
+    #+ by name with ``.local`` suffix.
+    if '.' not in domain:
+        domain += '.local'
+    return domain
+
+
+def _make_cookie(cookie):
+    """
+    Converts cookie of browser to cookie of :py:mod:`requests` with the same
+    domain, path, secure flag and expiration, so it's sent only to its domain
+    and path. Note that cookie jar of :py:mod:`requests` can't tell host-only
+    cookie from domain one (session policy is not used for requests), so
+    host-only cookie is sent also to subdomains of its host.
+    """
+    name, domain, path = _get_cookie_key(cookie)
+    return requests.cookies.create_cookie(
+        name,
+        cookie['value'],
+        domain=domain,
+        path=path,
+        secure=bool(cookie.get('secure')),
+        expires=cookie.get('expiry'),
+        rest={'HttpOnly': None} if cookie.get('httpOnly') else {},
+    )
+
+
+def _get_conditional_headers(session, cache_key):
+    etag, last_modified = session.conditional_cache.get(cache_key, (None, None))
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+def _store_conditional_headers(session, cache_key, response):
+    """
+    Keeps ``ETag`` and ``Last-Modified`` of successful response for next
+    conditional request of the same URL. Response ``304`` keeps stored ones.
+    """
+    if response.status_code == 304:
+        return
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if response.status_code == 200 and (etag or last_modified):
+        session.conditional_cache[cache_key] = (etag, last_modified)
+    else:
+        session.conditional_cache.pop(cache_key, None)
+
+
+def _close_session(driver):
+    session = getattr(driver, '_download_session', None)
+    if session is not None:
+        session.close()
+        driver._download_session = None
 
 
 class DownloadUrl(_Download):
-    def __init__(self, driver, url):
+    def __init__(self, driver, url, stream=False, method=None, conditional=False):
         self._driver = driver
+        self._stream = stream
+        self._method = method
+        self._conditional = conditional
 
         if not url:
             url = self._driver.current_url
@@ -80,46 +405,114 @@ class DownloadUrl(_Download):
 
 
 class DownloadFile(_Download):
-    def __init__(self, elm):
+    def __init__(self, elm, stream=False, method=None, conditional=False):
         self._elm = elm
         self._driver = elm._parent
+        self._stream = stream
+        self._method = method
+        self._conditional = conditional
         self._make_request()
 
     def _get_url_and_data(self):
         is_post = False
         data = None
 
-        url = self._elm.get_attribute('href')
+        #  Link, form and its data are read by one call, so preparing of
+        #+ request does not take longer than download itself.
+        info = self._driver.execute_script(_DOWNLOAD_INFO_SCRIPT, self._elm)
+        url = info['href']
         # If no href, element can be some form button. Then use attribute action
         # of that form.
         if not url:
-            form_elm = self._get_form_elm()
-            if form_elm:
-                url = form_elm.get_attribute('action')
-                data = self._get_form_data()
-                is_post = form_elm.get_attribute('method') == 'post'
+            form = info['form']
+            if form:
+                url = form['action']
+                data = [(name, value) for name, value in form['data']]
+                is_post = form['method'] == 'post'
         # If form has no action defined or it is not form, just use current url.
         if not url:
             url = self._elm.current_url
 
         return is_post, url, data
 
-    def _get_form_data(self):
-        form_elm = self._get_form_elm()
-        if not form_elm:
-            return None
 
-        elms = form_elm.get_elms(xpath='.//*[@name]')
-        data = dict((
-            elm.get_attribute('name').encode('utf8'),
-            elm.get_attribute('value').encode('utf8'),
-        ) for elm in elms)
-        return data
+class _LinkCheck(collections.namedtuple('_LinkCheck', ('url', 'status_code', 'method', 'latency', 'error'))):
+    """
+    Result of checking of one link. ``method`` is ``head`` or ``get`` (when
+    ``HEAD`` failed), ``latency`` is time of checking in seconds and ``error``
+    is exception when request failed (then there is no ``status_code``).
+    """
 
-    def _get_form_elm(self):
-        try:
-            form_elm = self._elm.get_elm(xpath='.//ancestor::form')
-        except Exception:  # pylint: disable=broad-except
-            return None
-        else:
-            return form_elm
+    @property
+    def ok(self):
+        return self.error is None and 200 <= self.status_code < 300
+
+
+class _LinksReport:
+    """
+    Object returned by calling
+    :py:meth:`~webdriverwrapper.wrapper._WebdriverWrapper.check_links`.
+    Iterating over it gives :py:class:`._LinkCheck` of every link.
+    """
+
+    def __init__(self, links):
+        self.links = links
+
+    def __iter__(self):
+        return iter(self.links)
+
+    def __len__(self):
+        return len(self.links)
+
+    def __bool__(self):
+        return not self.failed
+
+    @property
+    def failed(self):
+        """
+        Links with error or with status code out of 2xx.
+        """
+        return [link for link in self.links if not link.ok]
+
+    @property
+    def status_codes(self):
+        """
+        Dictionary of status codes by URL.
+        """
+        return dict((link.url, link.status_code) for link in self.links)
+
+    def __repr__(self):
+        return '<_LinksReport {} links, {} failed>'.format(len(self.links), len(self.failed))
+
+
+def _check_links(driver, scope_elm, concurrency, timeout):
+    hrefs = driver.execute_script(_COLLECT_LINKS_SCRIPT, scope_elm) or []
+    urls = []
+    seen_urls = set()
+    for href in hrefs:
+        url = urldefrag(href)[0]
+        if urlparse(url).scheme in ('http', 'https') and url not in seen_urls:
+            seen_urls.add(url)
+            urls.append(url)
+
+    #  Cookies are synced before threads start, because driver can't be
+    #+ used from more threads.
+    session = _get_session(driver)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        links = list(executor.map(lambda url: _check_link(session, url, timeout), urls))
+    return _LinksReport(links)
+
+
+def _check_link(session, url, timeout):
+    start = time.time()
+    method = 'head'
+    try:
+        response = session.head(url, allow_redirects=True, timeout=timeout)
+        # Some servers don't support HEAD or handle it differently.
+        if response.status_code >= 400:
+            method = 'get'
+            response = session.get(url, allow_redirects=True, timeout=timeout, stream=True)
+            response.close()
+    except requests.RequestException as exc:
+        return _LinkCheck(url, None, method, time.time() - start, exc)
+    return _LinkCheck(url, response.status_code, method, time.time() - start, None)
@@ -1,6 +1,5 @@
-from selenium.common.exceptions import NoSuchElementException
-
 from .exceptions import ErrorPageException, ErrorMessagesException, JSErrorsException
+from .health import _page_health_part, _page_health_scope, _get_page_health_value, _get_page_url
 
 __all__ = (
     'expected_error_page',
@@ -136,23 +135,34 @@ class WebdriverWrapperErrorMixin:
         To parameters you should pass same values like to decorators
         :py:func:`.expected_error_page`, :py:func:`.allowed_error_pages`,
         :py:func:`.expected_error_messages` and :py:func:`.allowed_error_messages`.
+
+        .. versionchanged:: 2.9
+            Error page, traceback, error messages and JS errors are collected
+            by one call. Methods like :py:meth:`.get_error_page` are called only
+            when they are customized.
         """
         # Close unexpected alerts (it's blocking).
-        self.close_alert(ignore_exception=True)
+        with self.unexpected_alerts_closed(), _page_health_scope(self):
+            self._check_errors(
+                expected_error_page, allowed_error_pages, expected_error_messages, allowed_error_messages,
+            )
 
+    def _check_errors(self, expected_error_page, allowed_error_pages, expected_error_messages, allowed_error_messages):
         expected_error_pages = set([expected_error_page]) if expected_error_page else set()
         allowed_error_pages = set(allowed_error_pages)
-        error_page = self.get_error_page()
+        error_page = _get_page_health_value(self, 'error_page')
         error_pages = set([error_page]) if error_page else set()
         if (
                 error_pages & expected_error_pages != expected_error_pages
                 or
                 error_pages - (expected_error_pages | allowed_error_pages)
         ):
-            traceback = self.get_error_traceback()
-            raise ErrorPageException(self.current_url, error_page, expected_error_page, allowed_error_pages, traceback)
+            traceback = _get_page_health_value(self, 'error_traceback')
+            raise ErrorPageException(
+                _get_page_url(self), error_page, expected_error_page, allowed_error_pages, traceback,
+            )
 
-        error_messages = set(self.get_error_messages())
+        error_messages = set(_get_page_health_value(self, 'error_messages'))
         expected_error_messages = set(expected_error_messages)
         allowed_error_messages = error_messages if allowed_error_messages is ANY else set(allowed_error_messages)
         if (
@@ -160,12 +170,15 @@ class WebdriverWrapperErrorMixin:
                 or
                 error_messages - (expected_error_messages | allowed_error_messages)
         ):
-            raise ErrorMessagesException(self.current_url, error_messages, expected_error_messages, allowed_error_messages)
+            raise ErrorMessagesException(
+                _get_page_url(self), error_messages, expected_error_messages, allowed_error_messages,
+            )
 
-        js_errors = self.get_js_errors()
+        js_errors = _get_page_health_value(self, 'js_errors')
         if js_errors:
-            raise JSErrorsException(self.current_url, js_errors)
+            raise JSErrorsException(_get_page_url(self), js_errors)
 
+    @_page_health_part('error_page')
     def get_error_page(self):
         """
         Method returning error page. Should return string.
@@ -176,14 +189,12 @@ class WebdriverWrapperErrorMixin:
         Error page returned from this method is used in decorators
         :py:func:`.expected_error_page` and :py:func:`.allowed_error_pages`.
         """
-        try:
-            error_page = self.get_elm(class_name='error-page')
-        except NoSuchElementException:
-            pass
-        else:
+        error_page = self._probe_elm(class_name='error-page')
+        if error_page:
             header = error_page.get_elm(tag_name='h1')
             return header.text
 
+    @_page_health_part('error_traceback')
     def get_error_traceback(self):
         """
         Method returning traceback of error page.
@@ -192,14 +203,11 @@ class WebdriverWrapperErrorMixin:
         of element with class ``traceback``. You can change this method
         accordingly to your app.
         """
-        try:
-            error_page = self.get_elm(class_name='error-page')
-            traceback = error_page.get_elm(class_name='traceback')
-        except NoSuchElementException:
-            pass
-        else:
+        traceback = self._probe_elm(parent_class_name='error-page', class_name='traceback')
+        if traceback:
             return traceback.text
 
+    @_page_health_part('error_messages')
     def get_error_messages(self):
         """
         Method returning error messages. Should return list of messages.
@@ -211,18 +219,15 @@ class WebdriverWrapperErrorMixin:
         Error messages returned from this method are used in decorators
         :py:func:`.expected_error_messages` and :py:func:`.allowed_error_messages`.
         """
+        error_elms = self.get_elms(class_name='error')
         try:
-            error_elms = self.get_elms(class_name='error')
-        except NoSuchElementException:
-            return []
-        else:
-            try:
-                error_values = [error_elm.get_attribute('error') for error_elm in error_elms]
-            except Exception:
-                error_values = [error_elm.text for error_elm in error_elms]
-            finally:
-                return error_values
+            error_values = [error_elm.get_attribute('error') for error_elm in error_elms]
+        except Exception:
+            error_values = [error_elm.text for error_elm in error_elms]
+        finally:
+            return error_values
 
+    @_page_health_part('js_errors')
     def get_js_errors(self):
         """
         Method returning JS errors. Should return list of errors.
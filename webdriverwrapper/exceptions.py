@@ -23,13 +23,65 @@ def _create_exception_msg(
     if url:
         msg += ' at {}'.format(url)
 
-    suggest = _get_suggestion(driver, id_, class_name, tag_name)
+    suggest = _get_suggestion(driver, id_, class_name, name)
     if suggest:
         msg += ' {}'.format(suggest)
 
     return msg
 
 
+class _LazyExceptionMsg:
+    """
+    Message of exception which is created only when it's needed. URL and
+    suggestion costs calls to browser which is useless when exception is
+    caught and thrown away (for example when probing whether element is
+    present). Message can be used as string.
+
+    Note that URL and suggestion are bound late: they describe the page at
+    time when message is used for the first time (usually right when the
+    exception is reported), not when it was raised. Then message is kept.
+    """
+
+    def __init__(self, get_url=None, driver=None, template='{}', **params):
+        self._get_url = get_url
+        self._driver = driver
+        self._template = template
+        self._params = params
+        self._msg = None
+
+    def __str__(self):
+        if self._msg is None:
+            try:
+                url = self._get_url() if self._get_url else None
+                msg = _create_exception_msg(url=url, driver=self._driver, **self._params)
+            except WebDriverException:
+                # Driver can be gone (or blocked by alert) when message is needed.
+                msg = _create_exception_msg(**self._params)
+            self._msg = self._template.format(msg)
+        return self._msg
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __contains__(self, item):
+        return item in str(self)
+
+    def __eq__(self, other):
+        return str(self) == str(other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __add__(self, other):
+        return str(self) + other
+
+    def __radd__(self, other):
+        return other + str(self)
+
+    def __len__(self):
+        return len(str(self))
+
+
 def _create_exception_msg_tag(
         id_=None, class_name=None, name=None, tag_name=None,
         parent_id=None, parent_class_name=None, parent_name=None, parent_tag_name=None,
@@ -64,7 +116,7 @@ def _create_exception_msg_tag_element(id_=None, class_name=None, name=None, tag_
 
 
 def _get_suggestion(driver, id_=None, class_name=None, name=None):
-    if not driver or not levenshteinDistance:
+    if not driver or not levenshteinDistance or not getattr(driver, 'suggestions', True):
         return ''
 
     if id_:
@@ -79,32 +131,145 @@ def _get_suggestion(driver, id_=None, class_name=None, name=None):
     else:
         return ''
 
-    # Can't be used xpath because it can return only element and then
-    # get attribute for every element is very slow. So by JS it's done
-    # by only one Selenium call.
-    items = driver.execute_script('return Array.prototype.map.call(document.querySelectorAll("[id]"), function(el) {return el.id})')
-    if not items:
+    index = _get_suggestion_index(driver)
+    if not index:
         return ''
 
-    suggestion = _find_best_suggestion(value, set(items))
+    suggestion = index.find_best(suggest_by, str(value))
     if not suggestion:
         return ''
 
     return 'did you mean {}={}?'.format(suggest_by, suggestion)
 
 
+#  Collects all ids, classes and names on page. Collected values are valid
+#+ until some change of DOM, so the script returns only null when nothing was
+#+ changed from version passed as argument.
+_COLLECT_SUGGESTIONS_SCRIPT = '''
+var cachedVersion = arguments[0];
+if (cachedVersion && window.__webdriverwrapperDomVersion === cachedVersion) {
+    return null;
+}
+if (!window.__webdriverwrapperDomObserver) {
+    window.__webdriverwrapperDomObserver = new MutationObserver(function () {
+        window.__webdriverwrapperDomVersion = null;
+    });
+    window.__webdriverwrapperDomObserver.observe(document, {
+        childList: true, subtree: true, attributes: true, attributeFilter: ['id', 'class', 'name']
+    });
+}
+var version = window.__webdriverwrapperDomVersion = Date.now() + ':' + Math.random();
+var items = {id: {}, 'class': {}, name: {}};
+Array.prototype.forEach.call(document.querySelectorAll('[id], [class], [name]'), function (elm) {
+    if (elm.id) {
+        items.id[elm.id] = true;
+    }
+    if (elm.getAttribute('name')) {
+        items.name[elm.getAttribute('name')] = true;
+    }
+    Array.prototype.forEach.call(elm.classList || [], function (cls) {
+        items['class'][cls] = true;
+    });
+});
+return {
+    version: version,
+    id: Object.keys(items.id),
+    'class': Object.keys(items['class']),
+    name: Object.keys(items.name)
+};
+'''
+
+
+def _get_suggestion_index(driver):
+    """
+    Returns :py:class:`._SuggestionIndex` of current page. It's cached on
+    driver until DOM is changed, so every next missing element costs only
+    one cheap call.
+    """
+    index = getattr(driver, '_suggestion_index', None)
+    data = driver.execute_script(_COLLECT_SUGGESTIONS_SCRIPT, index.version if index else None)
+    if not data:
+        return index if data is None else None
+    index = _SuggestionIndex(data)
+    driver._suggestion_index = index
+    return index
+
+
+class _SuggestionIndex:
+    """
+    Ids, classes and names of one version of page indexed for finding of
+    suggestions. Tree of every kind is built on its first use, because
+    usually only one kind is missing.
+    """
+
+    def __init__(self, data):
+        self.version = data['version']
+        self._data = data
+        self._trees = {}
+
+    def find_best(self, suggest_by, value):
+        if suggest_by not in self._trees:
+            self._trees[suggest_by] = _BKTree(self._data[suggest_by])
+        return self._trees[suggest_by].find_best(value, _get_max_suggestion_distance(value))
+
+
+class _BKTree:
+    """
+    BK-tree of strings by Levenshtein distance. Thanks to triangle inequality
+    finding of the closest item does not need to compute distance to every
+    item, whole subtrees are skipped.
+    """
+
+    def __init__(self, items=()):
+        self._root = None
+        for item in items:
+            self.add(item)
+
+    def add(self, item):
+        if self._root is None:
+            self._root = (item, {})
+            return
+        node = self._root
+        while True:
+            node_item, children = node
+            distance = levenshteinDistance(item, node_item)
+            if distance == 0:
+                return
+            if distance not in children:
+                children[distance] = (item, {})
+                return
+            node = children[distance]
+
+    def find_best(self, value, max_distance):
+        """
+        Returns the closest item to ``value`` (but not the same one) with
+        distance lower than ``max_distance``.
+        """
+        best = None
+        min_distance = max_distance
+        nodes = [self._root] if self._root else []
+        while nodes:
+            node_item, children = nodes.pop()
+            distance = levenshteinDistance(value, node_item)
+            if 0 < distance < min_distance:
+                min_distance = distance
+                best = node_item
+            # The most promising children go last, so they are checked first.
+            for child_distance in sorted(children, key=lambda d: -abs(d - distance)):
+                if distance - min_distance < child_distance < distance + min_distance:
+                    nodes.append(children[child_distance])
+        return best
+
+
 def _find_best_suggestion(value, items):
     if not levenshteinDistance:
         return None
+    return _BKTree(items).find_best(value, _get_max_suggestion_distance(value))
+
 
-    best = None
-    min_distance = len(value) + 10  # So it can find distance between btn and btn-default for example.
-    for item in items:
-        distance = levenshteinDistance(value, item)
-        if 0 < distance < min_distance:
-            min_distance = distance
-            best = item
-    return best
+def _get_max_suggestion_distance(value):
+    # So it can find distance between btn and btn-default for example.
+    return len(value) + 10
 
 
 class WebdriverWrapperException(Exception):
@@ -3,21 +3,130 @@
 from selenium.common.exceptions import WebDriverException, NoSuchElementException
 from selenium.webdriver.common.keys import Keys
 
-from webdriverwrapper.wrapper import _WebElementWrapper
+from webdriverwrapper.wrapper import _WebElementWrapper, _ConvertToWebelementWrapper
 from webdriverwrapper.exceptions import _create_exception_msg
 
 __all__ = ('Form',)
 
+#  Collects all elements with name in form with everything needed for filling
+#+ them out (the same what FormElement would find out call by call).
+_FORM_SCHEMA_SCRIPT = '''
+var schema = {};
+Array.prototype.forEach.call(arguments[0].querySelectorAll('[name]'), function (elm) {
+    var name = elm.getAttribute('name');
+    var tagName = elm.tagName.toLowerCase();
+    schema[name] = schema[name] || [];
+    schema[name].push({
+        element: elm,
+        tag_name: tagName,
+        type: typeof elm.type === 'string' ? elm.type : elm.getAttribute('type'),
+        value: elm.getAttribute('value'),
+        multiple: Boolean(elm.multiple),
+        options: tagName === 'select' ? Array.prototype.map.call(elm.options, function (option) {
+            return option.value;
+        }) : null
+    });
+});
+return schema;
+'''
+
+#  Fills out items prepared by FormElement.get_fill_script_item and fires
+#+ the same events as typing and clicking. Returns names of items which could
+#+ not be filled out (missing checkbox, radio or option with such value).
+_FILL_OUT_SCRIPT = '''
+var items = arguments[0];
+var skipReset = arguments[1];
+var missing = [];
+function fire(elm, type) {
+    var event = document.createEvent('HTMLEvents');
+    event.initEvent(type, type !== 'blur', true);
+    elm.dispatchEvent(event);
+}
+function findByValue(elms, value) {
+    for (var i = 0; i < elms.length; i++) {
+        if (elms[i].getAttribute('value') === value) {
+            return elms[i];
+        }
+    }
+    return null;
+}
+function setValue(elm, value) {
+    // Native setter is used, because frameworks (like React) track values set on instance.
+    for (var proto = Object.getPrototypeOf(elm); proto; proto = Object.getPrototypeOf(proto)) {
+        var descriptor = Object.getOwnPropertyDescriptor(proto, 'value');
+        if (descriptor && descriptor.set) {
+            descriptor.set.call(elm, value);
+            return;
+        }
+    }
+    elm.value = value;
+}
+function check(elm, checked, name) {
+    if (!elm) {
+        missing.push(name);
+    } else if (elm.checked !== checked) {
+        elm.click();
+    }
+}
+items.forEach(function (item) {
+    var elms = item.elements;
+    var value = item.value;
+    if (item.kind === 'checkbox' && Array.isArray(value)) {
+        value.forEach(function (itemValue) {
+            check(findByValue(elms, itemValue), true, item.name);
+        });
+    } else if (item.kind === 'checkbox') {
+        check(elms[0], value, item.name);
+    } else if (item.kind === 'radio') {
+        check(findByValue(elms, value), true, item.name);
+    } else if (item.kind === 'select') {
+        var select = elms[0];
+        var values = Array.isArray(value) ? value : [value];
+        var options = Array.prototype.slice.call(select.options);
+        values.forEach(function (itemValue) {
+            var found = options.some(function (option) {
+                return option.value === itemValue;
+            });
+            if (!found) {
+                missing.push(item.name);
+            }
+        });
+        options.forEach(function (option) {
+            if (values.indexOf(option.value) !== -1) {
+                option.selected = true;
+            } else if (select.multiple && !skipReset) {
+                option.selected = false;
+            }
+        });
+        fire(select, 'input');
+        fire(select, 'change');
+    } else {
+        var elm = elms[0];
+        setValue(elm, skipReset ? elm.value + value : value);
+        fire(elm, 'input');
+        fire(elm, 'change');
+        fire(elm, 'blur');
+    }
+});
+return missing;
+'''
+
+
+_CHECKED_SCRIPT = 'return arguments[0].map(function (elm) { return elm.checked; });'
+
 
 class Form(_WebElementWrapper):
-    def fill_out_and_submit(self, data, prefix='', skip_reset=False):
+    #  Elements with name by name, see _get_form_controls.
+    _form_schema = None
+
+    def fill_out_and_submit(self, data, prefix='', skip_reset=False, by_script=False, typed_fields=()):
         """
         Calls :py:meth:`~.Form.fill_out` and then :py:meth:`.submit`.
         """
-        self.fill_out(data, prefix, skip_reset)
+        self.fill_out(data, prefix, skip_reset, by_script, typed_fields)
         self.submit()
 
-    def fill_out(self, data, prefix='', skip_reset=False):
+    def fill_out(self, data, prefix='', skip_reset=False, by_script=False, typed_fields=()):
         """
         Fill out ``data`` by dictionary (key is name attribute of inputs). You
         can pass normal Pythonic data and don't have to care about how to use
@@ -50,9 +159,57 @@ class Form(_WebElementWrapper):
         .. versionchanged:: 2.2
             ``turbo`` renamed to ``skip_reset`` and used also for common elements
             like text inputs or textareas.
+
+        With ``by_script`` all values are set by one script instead of typing
+        and clicking, which is much faster for big forms or long texts. Script
+        fires events ``input``, ``change`` and ``blur`` as typing does, but
+        there is no key event. Fields which need real typing (e.g. with some
+        autocomplete) pass (without ``prefix``) in ``typed_fields``. File
+        inputs are always typed.
+
+        .. versionchanged:: 2.9
+            All elements of form are found and analyzed by one call at the
+            start of every filling out (and again when some name is missing,
+            because it can be added by JS meanwhile). Added ``by_script`` and
+            ``typed_fields`` params.
         """
+        # Form could be changed by JS since last filling out.
+        self._form_schema = None
+        if not by_script:
+            for elm_name, value in data.items():
+                FormElement(self, prefix + elm_name).fill_out(value, skip_reset)
+            return
+
+        script_items = []
+        typed_elms = []
         for elm_name, value in data.items():
-            FormElement(self, prefix + elm_name).fill_out(value, skip_reset)
+            form_elm = FormElement(self, prefix + elm_name)
+            script_item = None if elm_name in typed_fields else form_elm.get_fill_script_item(value)
+            if script_item:
+                script_items.append(script_item)
+            else:
+                typed_elms.append((form_elm, value))
+        if script_items:
+            self._fill_out_by_script(script_items, skip_reset)
+        for form_elm, value in typed_elms:
+            form_elm.fill_out(value, skip_reset)
+
+    def _get_form_controls(self, elm_name):
+        """
+        Returns list of dictionaries describing elements with name ``elm_name``
+        (element, tag name, type, value, multiple and options of select).
+        Whole form is introspected by one call on first need in every filling
+        out. When some name is missing, form is introspected again because it
+        can be added by JS.
+        """
+        if self._form_schema is None or elm_name not in self._form_schema:
+            self._form_schema = self._driver.execute_script(_FORM_SCHEMA_SCRIPT, self) or {}
+        return self._form_schema.get(elm_name, [])
+
+    def _fill_out_by_script(self, script_items, skip_reset):
+        missing = self._driver.execute_script(_FILL_OUT_SCRIPT, script_items, skip_reset)
+        if missing:
+            raise NoSuchElementException(_create_exception_msg(name=missing[0]))
 
     def submit(self):
         """
@@ -80,6 +237,7 @@ class FormElement:
     def __init__(self, form_elm, elm_name):
         self.form_elm = form_elm
         self.elm_name = elm_name
+        self._controls = None
 
     def convert_value(self, value):
         if not isinstance(value, (list, tuple)):
@@ -104,59 +262,99 @@ class FormElement:
         getattr(self, method_name, self.fill_common)(value, skip_reset)
 
     def analyze_element(self):
-        elms = self.form_elm.get_elms(name=self.elm_name)
-        for elm in elms:
-            elm_type = elm.get_attribute('type')
-            if elm_type == 'hidden':
+        for control in self.get_controls():
+            if control['type'] == 'hidden':
+                continue
+            return control['tag_name'], control['type']
+        raise NoSuchElementException(_create_exception_msg(name=self.elm_name))
+
+    def get_controls(self):
+        if self._controls is None:
+            self._controls = self.form_elm._get_form_controls(self.elm_name)
+        return self._controls
+
+    def get_elm(self, elm_type=None, value=None):
+        """
+        Returns first element with name of this form element (and with
+        ``elm_type`` and ``value`` when it's passed) without call to browser.
+        """
+        for control in self.get_controls():
+            if elm_type is not None and control['type'] != elm_type:
+                continue
+            if value is not None and control['value'] != value:
                 continue
-            return elm.tag_name, elm_type
+            return _ConvertToWebelementWrapper._convert_into_webelementwrapper(control['element'], control['tag_name'])
         raise NoSuchElementException(_create_exception_msg(name=self.elm_name))
 
+    def get_fill_script_item(self, value):
+        """
+        Returns item for filling out by script in
+        :py:meth:`Form.fill_out <webdriverwrapper.forms.Form.fill_out>` or
+        ``None`` when it has to be typed.
+        """
+        tag_name, elm_type = self.analyze_element()
+        if tag_name == 'input' and elm_type == 'file':
+            return None
+        if tag_name == 'input' and elm_type in ('checkbox', 'radio'):
+            kind = elm_type
+        elif tag_name == 'select':
+            kind = 'select'
+        else:
+            kind = 'common'
+        if kind == 'checkbox' and not isinstance(value, (list, tuple)):
+            value = bool(value)
+        else:
+            value = self.convert_value(value)
+        return {
+            'name': self.elm_name,
+            'kind': kind,
+            'elements': [control['element'] for control in self.get_controls() if control['type'] == elm_type],
+            'value': value,
+        }
+
     def fill_input_checkbox(self, value, skip_reset=False):
         if isinstance(value, (list, tuple)):
             self.fill_input_checkbox_multiple(value)
-        self.fill_input_checkbox_single(value)
+        else:
+            self.fill_input_checkbox_single(value)
 
     def fill_input_checkbox_single(self, value, skip_reset=False):
-        elm = self.form_elm.get_elm(xpath='//input[@type="checkbox"][@name="%s"]' % self.elm_name)
+        elm = self.get_elm('checkbox')
         if bool(value) != elm.is_selected():
             self._click_on_elm_or_his_ancestor(elm)
 
     def fill_input_checkbox_multiple(self, value, skip_reset=False):
-        for item in value:
-            elm = self.form_elm.get_elm(xpath='//input[@type="checkbox"][@name="%s"][@value="%s"]' %  (
-                self.elm_name,
-                self.convert_value(item),
-            ))
-            self._click_on_elm_or_his_ancestor(elm)
+        elms = [self.get_elm('checkbox', item) for item in self.convert_value(value)]
+        if not elms:
+            return
+        # States of all checkboxes are read by one call, only unchecked ones are clicked.
+        checked = self.form_elm._driver.execute_script(_CHECKED_SCRIPT, elms)
+        for elm, is_checked in zip(elms, checked):
+            if not is_checked:
+                self._click_on_elm_or_his_ancestor(elm)
 
     def fill_input_radio(self, value, skip_reset=False):
-        elm = self.form_elm.get_elm(xpath='//input[@type="radio"][@name="%s"][@value="%s"]' % (
-            self.elm_name,
-            self.convert_value(value),
-        ))
+        elm = self.get_elm('radio', self.convert_value(value))
         self._click_on_elm_or_his_ancestor(elm)
 
     def fill_input_file(self, value, skip_reset=False):
-        elm = self.form_elm.get_elm(name=self.elm_name)
+        elm = self.get_elm()
         elm.send_keys(self.convert_value(value))
 
     def fill_select_selectone(self, value, skip_reset=False):
-        select = self.form_elm.get_elm(name=self.elm_name)
+        select = self.get_elm()
         select.select_by_value(self.convert_value(value))
 
     def fill_select_selectmultiple(self, value, skip_reset=False):
         if not isinstance(value, (list, tuple)):
             value = [value]
 
-        select = self.form_elm.get_elm(name=self.elm_name)
-        if not skip_reset:
-            select.deselect_all()
-        for item in self.convert_value(value):
-            select.select_by_value(item)
+        #  Selenium's Select needs few calls for every option. All options
+        #+ are selected (and deselected) by one script instead.
+        self.form_elm._fill_out_by_script([self.get_fill_script_item(value)], skip_reset)
 
     def fill_common(self, value, skip_reset=False):
-        elm = self.form_elm.get_elm(name=self.elm_name)
+        elm = self.get_elm()
         if not skip_reset:
             elm.clear()
         elm.send_keys(self.convert_value(value))
@@ -0,0 +1,118 @@
+import contextlib
+
+__all__ = ()
+
+#  Parts of page health and methods returning them. When some method is
+#+ customized, its part is not collected and the method is called instead.
+_PAGE_HEALTH_METHODS = {
+    'error_page': 'get_error_page',
+    'error_traceback': 'get_error_traceback',
+    'error_messages': 'get_error_messages',
+    'info_messages': 'get_info_messages',
+    'js_errors': 'get_js_errors',
+}
+
+#  Collects by one call the same things as default methods get_error_page,
+#+ get_error_traceback, get_error_messages, get_info_messages and
+#+ get_js_errors. Error page without header is left for get_error_page.
+_PAGE_HEALTH_SCRIPT = '''
+var parts = arguments[0];
+var result = {};
+function has(part) {
+    return parts.indexOf(part) !== -1;
+}
+function text(elm) {
+    return (elm.innerText || '').trim();
+}
+function values(className, attribute) {
+    return Array.prototype.map.call(document.getElementsByClassName(className), function (elm) {
+        return elm.getAttribute(attribute);
+    });
+}
+var errorPage = document.getElementsByClassName('error-page')[0];
+if (has('error_page')) {
+    var header = errorPage && errorPage.getElementsByTagName('h1')[0];
+    if (!errorPage || header) {
+        result.error_page = header ? text(header) : null;
+    }
+}
+if (has('error_traceback')) {
+    var traceback = errorPage && errorPage.getElementsByClassName('traceback')[0];
+    result.error_traceback = traceback ? text(traceback) : null;
+}
+if (has('error_messages')) {
+    result.error_messages = values('error', 'error');
+}
+if (has('info_messages')) {
+    result.info_messages = values('info', 'info');
+}
+if (has('js_errors')) {
+    result.js_errors = window.jsErrors === undefined ? null : window.jsErrors;
+}
+try {
+    result.url = window.top.location.href;
+} catch (e) {
+    // Page can be in frame from another domain.
+}
+return result;
+'''
+
+
+def _page_health_part(part):
+    """
+    Marks default method returning ``part`` of page health. Such method does
+    not have to be called, its value is collected with other parts.
+    """
+    def wrapper(func):
+        func._page_health_part = part
+        return func
+    return wrapper
+
+
+@contextlib.contextmanager
+def _page_health_scope(driver):
+    """
+    Within this scope page health is collected only once (on first need) and
+    shared by all checks. Nested scopes use the outer one.
+    """
+    if getattr(driver, '_page_health', None) is not None:
+        yield
+        return
+    driver._page_health = {}
+    try:
+        yield
+    finally:
+        driver._page_health = None
+
+
+def _get_page_health_value(driver, part):
+    """
+    Returns ``part`` of page health. Value is returned by method of driver
+    when the method is customized or when part could not be collected.
+    """
+    method = getattr(driver, _PAGE_HEALTH_METHODS[part])
+    if getattr(method, '_page_health_part', None) != part:
+        return method()
+    health = _get_page_health(driver)
+    if part not in health:
+        return method()
+    return health[part]
+
+
+def _get_page_url(driver):
+    health = _get_page_health(driver)
+    return health.get('url') or driver.current_url
+
+
+def _get_page_health(driver):
+    health = getattr(driver, '_page_health', None)
+    if health:
+        return health
+    parts = [
+        part for part, method_name in _PAGE_HEALTH_METHODS.items()
+        if getattr(getattr(driver, method_name), '_page_health_part', None) == part
+    ]
+    collected_health = driver.execute_script(_PAGE_HEALTH_SCRIPT, parts) or {}
+    if health is not None:
+        health.update(collected_health)
+    return collected_health
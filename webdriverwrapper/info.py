@@ -1,6 +1,5 @@
-from selenium.common.exceptions import NoSuchElementException
-
 from .exceptions import InfoMessagesException
+from .health import _page_health_part, _page_health_scope, _get_page_health_value, _get_page_url
 
 __all__ = ('expected_info_messages', 'allowed_info_messages')
 
@@ -72,20 +71,27 @@ class WebdriverWrapperInfoMixin:
 
         To parameters you should pass same values like to decorators
         :py:func:`.expected_info_messages` and :py:func:`.allowed_info_messages`.
+
+        .. versionchanged:: 2.9
+            Info messages are collected by one call together with errors when
+            it's called in the same scope. Method :py:meth:`.get_info_messages`
+            is called only when it's customized.
         """
         # Close unexpected alerts (it's blocking).
-        self.close_alert(ignore_exception=True)
-
-        expected_info_messages = set(expected_info_messages)
-        allowed_info_messages = set(allowed_info_messages)
-        info_messages = set(self.get_info_messages())
-        if (
-                info_messages & expected_info_messages != expected_info_messages
-                or
-                (expected_info_messages and info_messages - (expected_info_messages | allowed_info_messages))
-        ):
-            raise InfoMessagesException(self.current_url, info_messages, expected_info_messages, allowed_info_messages)
-
+        with self.unexpected_alerts_closed(), _page_health_scope(self):
+            expected_info_messages = set(expected_info_messages)
+            allowed_info_messages = set(allowed_info_messages)
+            info_messages = set(_get_page_health_value(self, 'info_messages'))
+            if (
+                    info_messages & expected_info_messages != expected_info_messages
+                    or
+                    (expected_info_messages and info_messages - (expected_info_messages | allowed_info_messages))
+            ):
+                raise InfoMessagesException(
+                    _get_page_url(self), info_messages, expected_info_messages, allowed_info_messages,
+                )
+
+    @_page_health_part('info_messages')
     def get_info_messages(self):
         """
         Method returning info messages. Should return list of messages.
@@ -97,14 +103,10 @@ class WebdriverWrapperInfoMixin:
         Info messages returned from this method are used in decorators
         :py:func:`.expected_info_messages` and :py:func:`.allowed_info_messages`.
         """
+        info_elms = self.get_elms(class_name='info')
         try:
-            info_elms = self.get_elms(class_name='info')
-        except NoSuchElementException:
-            return []
-        else:
-            try:
-                info_values = [info_elm.get_attribute('info') for info_elm in info_elms]
-            except Exception:  # pylint: disable=broad-except
-                info_values = [info_elm.text for info_elm in info_elms]
-            finally:
-                return info_values
+            info_values = [info_elm.get_attribute('info') for info_elm in info_elms]
+        except Exception:  # pylint: disable=broad-except
+            info_values = [info_elm.text for info_elm in info_elms]
+        finally:
+            return info_values
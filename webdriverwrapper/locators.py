@@ -0,0 +1,146 @@
+import functools
+import re
+
+from selenium.webdriver.common.by import By
+
+__all__ = ()
+
+_TAG_NAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]*$')
+
+# Same condition as used for searching by text without parent.
+_TEXT_XPATH = '*/text()[contains(., {}) and not(ancestor-or-self::*[@data-selenium-not-search])]/..'
+
+
+def _compile_locator(*args, **kwds):
+    """
+    Compiles params of :py:meth:`~webdriverwrapper.wrapper._WebdriverBaseWrapper.get_elms`
+    into one pair ``(by, value)`` which can be passed to ``find_elements``,
+    so element in parent element is found by only one call. Returns ``None``
+    when it's not possible.
+
+    Params are used with the same priority as in ``get_elms``. Element without
+    parent is compiled into CSS selector (or XPath when searching by text).
+    Element in parent is always compiled into XPath, because only XPath can
+    search in first found parent as ``get_elms`` does.
+
+    Compiled locators are cached, so unhashable params (e.g. list) are not
+    compiled and ``None`` is returned for them as well.
+    """
+    try:
+        hash((args, tuple(kwds.items())))
+    except TypeError:
+        return None
+    return _compile_hashable_locator(*args, **kwds)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_hashable_locator(
+        id_=None, class_name=None, name=None, tag_name=None, text=None, xpath=None,
+        parent_id=None, parent_class_name=None, parent_name=None, parent_tag_name=None,
+        css_selector=None
+):
+    if parent_id or parent_class_name or parent_name or parent_tag_name:
+        if xpath is not None or css_selector is not None:
+            return None
+        return _compile_xpath_in_parent(
+            id_, class_name, name, tag_name, text,
+            parent_id, parent_class_name, parent_name, parent_tag_name,
+        )
+    if any(param is not None for param in (id_, class_name, name, tag_name, text)):
+        return _compile_css(id_, class_name, name, tag_name, text)
+    if xpath is not None:
+        return By.XPATH, xpath
+    if css_selector is not None:
+        return By.CSS_SELECTOR, css_selector
+    return None
+
+
+def _compile_xpath_in_parent(
+        id_, class_name, name, tag_name, text,
+        parent_id, parent_class_name, parent_name, parent_tag_name,
+):
+    parent_step = _compile_xpath_step(parent_id, parent_class_name, parent_name, parent_tag_name)
+    if any(param is not None for param in (id_, class_name, name, tag_name)):
+        step = _compile_xpath_step(id_, class_name, name, tag_name)
+    elif text is not None:
+        step = _TEXT_XPATH.format(_xpath_literal(text))
+    else:
+        step = None
+    if not parent_step or not step:
+        return None
+    return By.XPATH, '(.//{})[1]//{}'.format(parent_step, step)
+
+
+def _compile_css(id_=None, class_name=None, name=None, tag_name=None, text=None):
+    if id_ is not None:
+        selector = '[id={}]'.format(_css_string(id_))
+    elif class_name is not None:
+        selector = '[class~={}]'.format(_css_string(class_name)) if _is_single_class_name(class_name) else None
+    elif name is not None:
+        selector = '[name={}]'.format(_css_string(name))
+    elif tag_name is not None:
+        selector = tag_name if _TAG_NAME_RE.match(tag_name) else None
+    elif text is not None:
+        return By.XPATH, './/' + _TEXT_XPATH.format(_xpath_literal(text))
+    else:
+        selector = None
+    return (By.CSS_SELECTOR, selector) if selector else None
+
+
+def _compile_xpath_step(id_=None, class_name=None, name=None, tag_name=None):
+    if id_ is not None:
+        step = '*[@id={}]'.format(_xpath_literal(id_))
+    elif class_name is not None:
+        step = '*[contains(concat(" ", normalize-space(@class), " "), {})]'.format(
+            _xpath_literal(' {} '.format(class_name)),
+        ) if _is_single_class_name(class_name) else None
+    elif name is not None:
+        step = '*[@name={}]'.format(_xpath_literal(name))
+    elif tag_name is not None:
+        step = tag_name if _TAG_NAME_RE.match(tag_name) else None
+    else:
+        step = None
+    return step
+
+
+def _is_single_class_name(class_name):
+    # Empty or compound class name can't be compiled the same as searching by class name works.
+    return bool(class_name) and ' ' not in class_name
+
+
+def _xpath_literal(value):
+    """
+    XPath 1.0 has no escaping in strings. String with both types of quotes
+    has to be composed by function ``concat``.
+    """
+    value = str(value)
+    if '"' not in value:
+        return '"{}"'.format(value)
+    if "'" not in value:
+        return "'{}'".format(value)
+    return 'concat({})'.format(', \'"\', '.join('"{}"'.format(part) for part in value.split('"')))
+
+
+def _css_string(value):
+    value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\a ')
+    return '"{}"'.format(value)
+
+
+#  Function for scripts finding elements by locator compiled by
+#+ _compile_locator in the same way as find_elements does.
+_FIND_ELEMENTS_JS = '''
+function findElements(by, value, root) {
+    root = root || document;
+    if (by === 'css selector') {
+        return Array.prototype.slice.call(root.querySelectorAll(value));
+    }
+    var result = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var elements = [];
+    for (var i = 0; i < result.snapshotLength; i++) {
+        if (result.snapshotItem(i).nodeType === Node.ELEMENT_NODE) {
+            elements.push(result.snapshotItem(i));
+        }
+    }
+    return elements;
+}
+'''
@@ -4,6 +4,8 @@ import os
 
 import pytest
 
+from webdriverwrapper.health import _page_health_scope
+
 __all__ = ('pytest_report_header', 'pytest_runtest_makereport', 'set_driver_to_test_for_failed_screenshot', 'driver')
 
 
@@ -88,9 +90,9 @@ def make_screenshot_of_failed_tests(driver, config, nodeid):
     if not screenshot_path:
         return
 
-    driver.close_alert(ignore_exception=True)
     name = nodeid.replace('/', '.').replace(':', '.')
-    driver.get_screenshot_as_file(os.path.join(screenshot_path, '{}.png'.format(name)))
+    with driver.unexpected_alerts_closed():
+        driver.get_screenshot_as_file(os.path.join(screenshot_path, '{}.png'.format(name)))
 
 
 @pytest.yield_fixture(scope='function')
@@ -102,6 +104,9 @@ def driver(request, _driver):
     and :py:meth:`~webdriverwrapper.info.WebdriverWrapperInfoMixin.check_expected_infos`.
     You have to just implement creating of your browser.
 
+    When ``config.webdriverwrapper_testing_url`` is set, it's used as
+    :py:attr:`~webdriverwrapper.wrapper._WebdriverWrapper.base_url` of driver.
+
     .. code-block:: python
 
         @pytest.yield_fixture(scope='session')
@@ -111,7 +116,10 @@ def driver(request, _driver):
             driver.quit()
     """
     _driver.screenshot_path = getattr(request.config, 'webdriverwrapper_screenshot_path', None)
+    if not _driver.base_url:
+        _driver.base_url = getattr(request.config, 'webdriverwrapper_testing_url', None)
     _driver.close_other_windows()
     yield _driver
-    _driver.check_expected_errors(test_method=request.function)
-    _driver.check_expected_infos(test_method=request.function)
+    with _page_health_scope(_driver):
+        _driver.check_expected_errors(test_method=request.function)
+        _driver.check_expected_infos(test_method=request.function)
@@ -4,8 +4,10 @@ import logging
 logging.basicConfig(level=logging.INFO)
 import unittest
 import sys
+from urllib.parse import urlparse
 
 import webdriverwrapper.exceptions as exceptions
+from webdriverwrapper.health import _page_health_scope
 from webdriverwrapper.wrapper import Firefox, Chrome, ChromeOptions
 
 __all__ = (
@@ -54,6 +56,10 @@ class WebdriverTestCase(unittest.TestCase):
     without having to call for first time
     :py:meth:`get <selenium.webdriver.remote.webdriver.WebDriver.get>` (because
     before that you can't use relative path), set this attribute.
+
+    .. versionchanged:: 2.9
+        When it's absolute URL, it's used as
+        :py:attr:`~webdriverwrapper.wrapper._WebdriverWrapper.base_url` of driver.
     """
 
     instances_of_driver = ONE_INSTANCE_FOR_ALL_TESTS
@@ -110,8 +116,9 @@ class WebdriverTestCase(unittest.TestCase):
                 #+ server error. It's good to know about it - it can say more
                 #+ than that some element couldn't be found.
                 try:
-                    self.driver.check_expected_errors(test_method)
-                    self.driver.check_expected_infos(test_method)
+                    with _page_health_scope(self.driver):
+                        self.driver.check_expected_errors(test_method)
+                        self.driver.check_expected_infos(test_method)
                 except:
                     result.addError(self, sys.exc_info())
                 return
@@ -129,8 +136,9 @@ class WebdriverTestCase(unittest.TestCase):
                 result.addError(self, sys.exc_info())
 
             try:
-                self.driver.check_expected_errors(test_method)
-                self.driver.check_expected_infos(test_method)
+                with _page_health_scope(self.driver):
+                    self.driver.check_expected_errors(test_method)
+                    self.driver.check_expected_infos(test_method)
             except:
                 ok = False
                 result.addError(self, sys.exc_info())
@@ -174,9 +182,8 @@ class WebdriverTestCase(unittest.TestCase):
             screenshot_name = self.id()
 
         # Close unexpected alerts (it's blocking and then tests fails completely).
-        self.driver.close_alert(ignore_exception=True)
-
-        self.driver.get_screenshot_as_file('%s/%s.png' % (self.screenshot_path, screenshot_name))
+        with self.driver.unexpected_alerts_closed():
+            self.driver.get_screenshot_as_file('%s/%s.png' % (self.screenshot_path, screenshot_name))
 
     def _set_up(self):
         self.__class__._number_of_test += 1
@@ -185,6 +192,8 @@ class WebdriverTestCase(unittest.TestCase):
             WebdriverTestCase.screenshot_path = self.screenshot_path
             WebdriverTestCase._main_window = WebdriverTestCase.driver.current_window_handle
             if self.domain:
+                if urlparse(self.domain).netloc and not WebdriverTestCase.driver.base_url:
+                    WebdriverTestCase.driver.base_url = self.domain
                 WebdriverTestCase.driver.get(self.domain)
 
         # Ensure that test starts in main window.
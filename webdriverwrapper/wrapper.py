@@ -1,6 +1,6 @@
 # pylint: disable=wildcard-import,unused-wildcard-import,function-redefined,too-many-ancestors
 
-import copy
+import contextlib
 import functools
 import logging
 import time
@@ -10,14 +10,20 @@ import selenium.common.exceptions as selenium_exc
 from selenium.webdriver import *
 from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.firefox.webelement import FirefoxWebElement
+try:
+    from selenium.webdriver.remote.webelement import isDisplayed_js
+except ImportError:
+    isDisplayed_js = None
 from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.webdriver.support.wait import POLL_FREQUENCY
 
-from .download import DownloadUrl, DownloadFile
+from .download import DownloadUrl, DownloadFile, _check_links, _close_session
 from .errors import WebdriverWrapperErrorMixin
-from .exceptions import _create_exception_msg
+from .exceptions import _LazyExceptionMsg
 from .info import WebdriverWrapperInfoMixin
+from .locators import _compile_locator, _FIND_ELEMENTS_JS
 
 logging.basicConfig(level=logging.INFO)
 
@@ -37,6 +43,300 @@ __all__ = (
 )
 
 
+#  Names of params of get_elm(s) in order, so positional arguments can be
+#+ converted to keyword ones.
+_GET_ELMS_PARAMS = (
+    'id_', 'class_name', 'name', 'tag_name', 'text', 'xpath',
+    'parent_id', 'parent_class_name', 'parent_name', 'parent_tag_name',
+    'css_selector',
+)
+
+#  Tag names of all found elements are resolved by one call. Otherwise it
+#+ would cost one call per element just to know which wrapper to use.
+_TAG_NAMES_SCRIPT = 'return arguments[0].map(function(elm) { return elm.tagName.toLowerCase(); });'
+
+#  Wrapper classes rebased to another implementation of element (e.g. Firefox
+#+ one) by (wrapper class, element class).
+_REBASED_ELEMENT_CLASSES = {}
+
+#  Same check of visibility as is_displayed does. Older Selenium does not
+#+ provide its atom, then is used simple check of size of element.
+_IS_DISPLAYED_JS = 'var isDisplayed = {};'.format(
+    '(' + isDisplayed_js + ')' if isDisplayed_js else
+    'function(elm) { return !!(elm.offsetWidth || elm.offsetHeight || elm.getClientRects().length); }'
+)
+
+#  Waits for condition "present", "show" or "hide" of elements by observing
+#+ changes of DOM. Visibility can be changed also without change of DOM (CSS
+#+ transitions, animations, loading of images, ...), so for "show" and "hide"
+#+ it's checked also after every transition or animation and periodically.
+#+ It returns found (or visible) elements, or null when time is up.
+_WAIT_FOR_ELEMENTS_SCRIPT = _FIND_ELEMENTS_JS + '''
+var by = arguments[0], value = arguments[1], root = arguments[2], condition = arguments[3], timeout = arguments[4];
+var done = arguments[arguments.length - 1];
+var checkInterval = 100;
+function check() {
+    var elements = findElements(by, value, root);
+    if (condition === 'present') {
+        return elements.length ? elements : null;
+    }
+    var displayed = elements.filter(function (elm) { return isDisplayed(elm); });
+    if (condition === 'show') {
+        return displayed.length ? displayed : null;
+    }
+    return displayed.length ? null : [];
+}
+var result = check();
+if (result) {
+    done(result);
+    return;
+}
+var timer = null;
+var interval = null;
+var visibilityEvents = ['transitionend', 'animationend', 'load'];
+function finish(result) {
+    observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(interval);
+    visibilityEvents.forEach(function (name) {
+        document.removeEventListener(name, onChange, true);
+    });
+    done(result);
+}
+function onChange() {
+    var result = check();
+    if (result) {
+        finish(result);
+    }
+}
+var observer = new MutationObserver(onChange);
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+if (condition !== 'present') {
+    visibilityEvents.forEach(function (name) {
+        document.addEventListener(name, onChange, true);
+    });
+    interval = setInterval(onChange, checkInterval);
+}
+timer = setTimeout(function () {
+    finish(null);
+}, timeout);
+'''
+_WAIT_FOR_VISIBILITY_SCRIPT = _IS_DISPLAYED_JS + _WAIT_FOR_ELEMENTS_SCRIPT
+
+_IS_DISPLAYED_ELEMENTS_SCRIPT = _IS_DISPLAYED_JS + \
+    'return arguments[0].map(function (elm) { return isDisplayed(elm); });'
+
+#  Returns one chunk of elements found by locator compiled by _compile_locator
+#+ together with their tag names, so they can be wrapped without another call.
+#+ Elements are found only for first chunk and kept in page under returned
+#+ token for next chunks (token is null when there is no next chunk). When
+#+ page is reloaded meanwhile, elements are found again.
+_ELEMENTS_CHUNK_SCRIPT = _FIND_ELEMENTS_JS + '''
+var store = window.__webdriverwrapperElements = window.__webdriverwrapperElements || {};
+var token = arguments[3], start = arguments[4], end = arguments[5];
+var elements = token && store[token];
+if (!elements) {
+    elements = findElements(arguments[0], arguments[1], arguments[2]);
+    token = token || Date.now() + ':' + Math.random();
+}
+if (end < elements.length) {
+    store[token] = elements;
+} else {
+    delete store[token];
+    token = null;
+}
+var chunk = elements.slice(start, end);
+return [token, chunk, chunk.map(function (elm) { return elm.tagName.toLowerCase(); })];
+'''
+_FORGET_ELEMENTS_SCRIPT = '''
+if (window.__webdriverwrapperElements) {
+    delete window.__webdriverwrapperElements[arguments[0]];
+}
+'''
+
+#  Extracts fields of elements found by locator compiled by _compile_locator
+#+ (or of elements passed as argument when locator can't be compiled).
+_EXTRACT_SCRIPT = _FIND_ELEMENTS_JS + '''
+var elements = arguments[0] ? findElements(arguments[0], arguments[1], arguments[2]) : arguments[3];
+var fields = arguments[4];
+function extract(elm, field) {
+    if (field === 'text') {
+        return (elm.innerText || '').trim();
+    }
+    if (field === 'tag_name') {
+        return elm.tagName.toLowerCase();
+    }
+    if (field.charAt(0) === '@') {
+        return elm.getAttribute(field.substr(1));
+    }
+    var value = elm[field];
+    return value === undefined ? null : value;
+}
+return elements.map(function (elm) {
+    return fields.map(function (field) {
+        return extract(elm, field);
+    });
+});
+'''
+
+#  Returns texts of cells of rows from arguments[1] to arguments[2] (or to the
+#+ end) of table. Cells spanning more columns or rows are placed to all of
+#+ them, so all rows have cells in the same columns. Rows before range have to
+#+ be walked through as well to know where cells spanning more rows are.
+_EXTRACT_TABLE_SCRIPT = '''
+var rows = arguments[0].rows;
+var start = arguments[1];
+var end = arguments[2] === null ? rows.length : Math.min(arguments[2], rows.length);
+var spans = [];
+var result = [];
+function text(source) {
+    if (source.text === undefined) {
+        source.text = (source.cell.innerText || '').trim();
+    }
+    return source.text;
+}
+function spanned(col) {
+    return spans[col] && spans[col].rows > 0;
+}
+function takeSpanned(values, col, inRange) {
+    spans[col].rows--;
+    values[col] = inRange ? text(spans[col].source) : null;
+}
+for (var r = 0; r < end; r++) {
+    var inRange = r >= start;
+    var values = [];
+    var col = 0;
+    var cells = rows[r].cells;
+    for (var i = 0; i < cells.length; i++) {
+        for (; spanned(col); col++) {
+            takeSpanned(values, col, inRange);
+        }
+        var source = {cell: cells[i]};
+        var rowSpan = cells[i].rowSpan === 0 ? rows.length - r : Math.max(cells[i].rowSpan, 1);
+        for (var c = 0; c < Math.max(cells[i].colSpan, 1); c++, col++) {
+            spans[col] = {source: source, rows: rowSpan - 1};
+            values[col] = inRange ? text(source) : null;
+        }
+    }
+    for (; col < spans.length; col++) {
+        if (spanned(col)) {
+            takeSpanned(values, col, inRange);
+        } else {
+            values[col] = null;
+        }
+    }
+    if (inRange) {
+        result.push(values);
+    }
+}
+return result;
+'''
+
+_ALERT_COMMANDS = (
+    Command.ACCEPT_ALERT,
+    Command.DISMISS_ALERT,
+    Command.GET_ALERT_TEXT,
+    Command.SET_ALERT_VALUE,
+    Command.W3C_ACCEPT_ALERT,
+    Command.W3C_DISMISS_ALERT,
+    Command.W3C_GET_ALERT_TEXT,
+    Command.W3C_SET_ALERT_VALUE,
+)
+_ALERT_CLOSING_COMMANDS = (
+    Command.ACCEPT_ALERT,
+    Command.DISMISS_ALERT,
+    Command.W3C_ACCEPT_ALERT,
+    Command.W3C_DISMISS_ALERT,
+)
+
+#  Commands which can't navigate, so scheme and domain of last visited page
+#+ (used by get_url) stays valid. Any other command (click, submit, back,
+#+ script, ...) can navigate.
+_ORIGIN_KEEPING_COMMANDS = frozenset((
+    Command.FIND_ELEMENT,
+    Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT,
+    Command.FIND_CHILD_ELEMENTS,
+    Command.GET_ACTIVE_ELEMENT,
+    Command.W3C_GET_ACTIVE_ELEMENT,
+    Command.GET_ELEMENT_ATTRIBUTE,
+    Command.GET_ELEMENT_PROPERTY,
+    Command.GET_ELEMENT_TAG_NAME,
+    Command.GET_ELEMENT_TEXT,
+    Command.GET_ELEMENT_VALUE,
+    Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY,
+    Command.GET_ELEMENT_LOCATION,
+    Command.GET_ELEMENT_RECT,
+    Command.GET_ELEMENT_SIZE,
+    Command.IS_ELEMENT_DISPLAYED,
+    Command.IS_ELEMENT_ENABLED,
+    Command.IS_ELEMENT_SELECTED,
+    Command.GET_TITLE,
+    Command.GET_PAGE_SOURCE,
+    Command.SCREENSHOT,
+    Command.ELEMENT_SCREENSHOT,
+    Command.GET_ALL_COOKIES,
+    Command.GET_COOKIE,
+    Command.GET_ALERT_TEXT,
+    Command.W3C_GET_ALERT_TEXT,
+    Command.GET_CURRENT_WINDOW_HANDLE,
+    Command.W3C_GET_CURRENT_WINDOW_HANDLE,
+    Command.GET_WINDOW_HANDLES,
+    Command.W3C_GET_WINDOW_HANDLES,
+    Command.GET_WINDOW_RECT,
+    Command.GET_WINDOW_SIZE,
+    Command.W3C_GET_WINDOW_SIZE,
+))
+
+_WINDOW_HANDLE_COMMANDS = (Command.GET_CURRENT_WINDOW_HANDLE, Command.W3C_GET_CURRENT_WINDOW_HANDLE)
+_WINDOW_HANDLES_COMMANDS = (Command.GET_WINDOW_HANDLES, Command.W3C_GET_WINDOW_HANDLES)
+_WINDOW_COMMANDS = _WINDOW_HANDLE_COMMANDS + _WINDOW_HANDLES_COMMANDS + (
+    Command.SWITCH_TO_WINDOW,
+    Command.CLOSE,
+    Command.QUIT,
+    Command.GET,
+    Command.GET_CURRENT_URL,
+    Command.GET_TITLE,
+)
+
+#  Hooks alert, confirm and prompt, so script ends right before alert is
+#+ opened. Returns false when no alert is opened in timeout.
+_WAIT_FOR_ALERT_SCRIPT = '''
+var timeout = arguments[0];
+var done = arguments[arguments.length - 1];
+var originals = {};
+function restore() {
+    Object.keys(originals).forEach(function (name) {
+        window[name] = originals[name];
+    });
+}
+var timer = setTimeout(function () {
+    restore();
+    done(null);
+}, timeout);
+['alert', 'confirm', 'prompt'].forEach(function (name) {
+    var original = originals[name] = window[name];
+    window[name] = function () {
+        clearTimeout(timer);
+        restore();
+        done(true);
+        return original.apply(window, arguments);
+    };
+});
+'''
+
+
+def _get_elms_params(args, kwds):
+    """
+    Returns params of :py:meth:`~._WebdriverBaseWrapper.get_elms` as keyword
+    ones checked the same way as ``get_elms`` does.
+    """
+    params = dict(zip(_GET_ELMS_PARAMS, args), **kwds)
+    if len([key for key in ('id_', 'class_name', 'tag_name', 'text', 'xpath') if params.get(key) is not None]) > 1:
+        raise Exception('You can find element only by one param.')
+    return params
+
+
 class _ConvertToWebelementWrapper:
     def __call__(self, f):
         @functools.wraps(f)
@@ -51,17 +351,39 @@ class _ConvertToWebelementWrapper:
         if type(res) is driver._web_element_cls:
             res = cls._convert_into_webelementwrapper(res)
         elif isinstance(res, (list, tuple)):
+            tag_names = cls._get_tag_names(driver, res)
             for index, item in enumerate(res):
-                res[index] = cls._convert_result(driver, item)
+                if tag_names and type(item) is driver._web_element_cls:
+                    res[index] = cls._convert_into_webelementwrapper(item, next(tag_names))
+                else:
+                    res[index] = cls._convert_result(driver, item)
         return res
 
     @classmethod
-    def _convert_into_webelementwrapper(cls, webelement):
+    def _get_tag_names(cls, driver, items):
+        """
+        Returns iterator of tag names of all elements in ``items`` resolved by
+        one call. For single element or when some element is stale it returns
+        ``None`` and tag name is then read for each element separately.
+        """
+        webelements = [item for item in items if type(item) is driver._web_element_cls]
+        if len(webelements) < 2:
+            return None
         try:
-            if webelement.tag_name == 'form':
+            tag_names = driver.execute_script(_TAG_NAMES_SCRIPT, webelements)
+        except selenium_exc.WebDriverException:
+            return None
+        return iter(tag_names)
+
+    @classmethod
+    def _convert_into_webelementwrapper(cls, webelement, tag_name=None):
+        try:
+            if tag_name is None:
+                tag_name = webelement.tag_name
+            if tag_name == 'form':
                 from webdriverwrapper.forms import Form
-                wrapped = Form(webelement)
-            elif webelement.tag_name == 'select':
+                wrapped = cls._make_instance(Form, webelement)
+            elif tag_name == 'select':
                 wrapped = cls._make_instance(_SelectWrapper, webelement)
             else:
                 wrapped = cls._make_instance(_WebElementWrapper, webelement)
@@ -76,14 +398,28 @@ class _ConvertToWebelementWrapper:
         Firefox uses another implementation of element. This method
         switch base of wrapped element to firefox one.
         """
-        if isinstance(webelement, FirefoxWebElement):
-            element_class = copy.deepcopy(element_class)
-            element_class.__bases__ = tuple(
-                FirefoxWebElement if base is WebElement else base
-                for base in element_class.__bases__
-            )
+        webelement_class = type(webelement)
+        if not issubclass(element_class, webelement_class):
+            element_class = cls._get_rebased_class(element_class, webelement_class)
         return element_class(webelement)
 
+    @classmethod
+    def _get_rebased_class(cls, element_class, webelement_class):
+        """
+        Returns subclass of ``element_class`` based also on ``webelement_class``.
+        It's created only once for every combination, so all wrapped elements
+        share the same class.
+        """
+        key = (element_class, webelement_class)
+        rebased_class = _REBASED_ELEMENT_CLASSES.get(key)
+        if rebased_class is None:
+            rebased_class = type(element_class.__name__, (element_class, webelement_class), {
+                '__module__': element_class.__module__,
+                '__doc__': element_class.__doc__,
+            })
+            _REBASED_ELEMENT_CLASSES[key] = rebased_class
+        return rebased_class
+
 
 class _WebdriverBaseWrapper:
     """
@@ -99,6 +435,31 @@ class _WebdriverBaseWrapper:
     .. versionadded:: 2.7
     """
 
+    use_mutation_observer = True
+    """
+    Wait* methods (such as wait_for_element) wait in browser for change of
+    DOM by ``MutationObserver`` instead of polling every half a second, so
+    they end right after the element appears (or hides). Polling is used
+    when the lookup can't be compiled into one locator or when asynchronous
+    scripts can't be used. Waiting from elements uses the setting of driver.
+
+    .. versionadded:: 2.9
+    """
+
+    #  Maximal time in seconds of one asynchronous script waiting for elements,
+    #+ so it does not hit script timeout of driver. Longer waits use more calls.
+    _mutation_observer_slice = 5
+
+    #  Class of Selenium used for find methods. It's the first class after this
+    #+ one in MRO and it's resolved only once when the wrapper class is created.
+    _seleniums_driver_class = None
+
+    def __init_subclass__(cls, **kwds):
+        super().__init_subclass__(**kwds)
+        mro = cls.mro()
+        index = mro.index(_WebdriverBaseWrapper)
+        cls._seleniums_driver_class = mro[index + 1] if index + 1 < len(mro) else None
+
     def contains_text(self, text):
         """
         Does page or element contains `text`?
@@ -161,11 +522,11 @@ class _WebdriverBaseWrapper:
             css_selector
         )
         if not elms:
-            raise selenium_exc.NoSuchElementException(_create_exception_msg(
-                id_, class_name, name, tag_name,
-                parent_id, parent_class_name, parent_name, parent_tag_name,
-                text, xpath, css_selector, self.current_url,
-                driver=self._driver,
+            raise selenium_exc.NoSuchElementException(_LazyExceptionMsg(
+                lambda: self.current_url, self._driver,
+                id_=id_, class_name=class_name, name=name, tag_name=tag_name, text=text, xpath=xpath,
+                parent_id=parent_id, parent_class_name=parent_class_name, parent_name=parent_name,
+                parent_tag_name=parent_tag_name, css_selector=css_selector,
             ))
         return elms[0]
 
@@ -191,30 +552,179 @@ class _WebdriverBaseWrapper:
         .. versionchanged:: 2.8
             Added ``text`` param. Use it instead of old ``find_element[s]_by_text`` methods.
             Thanks to that it can be used also in ``wait_for_element*`` methods.
+        .. versionchanged:: 2.9
+            Element in parent element is found by one call (parent and element
+            are compiled into one XPath). When parent is not found, it returns
+            empty list instead of raising ``NoSuchElementException``.
         """
+        if len([x for x in (id_, class_name, tag_name, text, xpath) if x is not None]) > 1:
+            raise Exception('You can find element only by one param.')
+
         if parent_id or parent_class_name or parent_name or parent_tag_name:
-            parent = self.get_elm(parent_id, parent_class_name, parent_name, parent_tag_name)
+            #  Element in parent element is found by one call if possible
+            #+ instead of looking for parent first.
+            locator = _compile_locator(
+                id_, class_name, name, tag_name, text, xpath,
+                parent_id, parent_class_name, parent_name, parent_tag_name,
+                css_selector
+            )
+            if locator:
+                return self.find_elements(*locator)
+            parents = self.get_elms(parent_id, parent_class_name, parent_name, parent_tag_name)
+            if not parents:
+                return []
+            parent = parents[0]
         else:
             parent = self
 
-        if len([x for x in (id_, class_name, tag_name, text, xpath) if x is not None]) > 1:
-            raise Exception('You can find element only by one param.')
-
         if id_ is not None:
-            return parent.find_elements_by_id(id_)
-        if class_name is not None:
-            return parent.find_elements_by_class_name(class_name)
-        if name is not None:
-            return parent.find_elements_by_name(name)
-        if tag_name is not None:
-            return parent.find_elements_by_tag_name(tag_name)
-        if text is not None:
-            xpath = './/*/text()[contains(., "{}") and not(ancestor-or-self::*[@data-selenium-not-search])]/..'.format(text)
-        if xpath is not None:
-            return parent.find_elements_by_xpath(xpath)
-        if css_selector is not None:
-            return parent.find_elements_by_css_selector(css_selector)
-        raise Exception('You must specify id or name of element on which you want to click.')
+            by, value = By.ID, id_
+        elif class_name is not None:
+            by, value = By.CLASS_NAME, class_name
+        elif name is not None:
+            by, value = By.NAME, name
+        elif tag_name is not None:
+            by, value = By.TAG_NAME, tag_name
+        elif text is not None:
+            by, value = By.XPATH, (
+                './/*/text()[contains(., "{}") and not(ancestor-or-self::*[@data-selenium-not-search])]/..'
+            ).format(text)
+        elif xpath is not None:
+            by, value = By.XPATH, xpath
+        elif css_selector is not None:
+            by, value = By.CSS_SELECTOR, css_selector
+        else:
+            raise Exception('You must specify id or name of element on which you want to click.')
+        return parent.find_elements(by, value)
+
+    def _probe_elm(self, *args, **kwds):
+        """
+        Returns first element found by :py:meth:`~._WebdriverBaseWrapper.get_elms`
+        or ``None``. Used for probing of elements which are missing in normal
+        case (like error page), so it never raises ``NoSuchElementException``
+        and never creates message for it.
+        """
+        elms = self.get_elms(*args, **kwds)
+        return elms[0] if elms else None
+
+    def get_displayed_elms(self, *args, **kwds):
+        """
+        Returns only visible elements of those found by
+        :py:meth:`~._WebdriverBaseWrapper.get_elms`. Visibility of all found
+        elements is checked by one call, so it's much faster than calling
+        ``is_displayed`` on every element.
+
+        .. versionadded:: 2.9
+        """
+        elms = self.get_elms(*args, **kwds)
+        if not elms:
+            return []
+        displayed = self._driver.execute_script(_IS_DISPLAYED_ELEMENTS_SCRIPT, elms)
+        return [elm for elm, is_displayed in zip(elms, displayed) if is_displayed]
+
+    def iter_elms(self, *args, chunk_size=100, **kwds):
+        """
+        Generator of elements found by params of
+        :py:meth:`~._WebdriverBaseWrapper.get_elms`. Elements are found once
+        and kept in page, then they are transferred and wrapped by chunks of
+        ``chunk_size`` elements, one call per chunk, so only one chunk is in
+        memory and nothing more is transferred when you stop iterating.
+
+        Elements found at the start are iterated even when page is changed
+        meanwhile. Only when page is reloaded, elements are found again and
+        some can be skipped or repeated.
+
+        When params can't be compiled into one locator (``xpath`` or
+        ``css_selector`` in parent, or more classes in ``class_name``), all
+        elements are found and wrapped at once by
+        :py:meth:`~._WebdriverBaseWrapper.get_elms`.
+
+        .. code-block:: python
+
+            for row in driver.iter_elms(tag_name='tr'):
+                if row.text == 'needle':
+                    break
+
+        .. versionadded:: 2.9
+        """
+        params = _get_elms_params(args, kwds)
+        locator = _compile_locator(**params)
+        if not locator:
+            yield from self.get_elms(**params)
+            return
+
+        root = None if self._driver is self else self
+        token = None
+        start = 0
+        try:
+            while True:
+                token, webelements, tag_names = self._driver.execute_script(
+                    _ELEMENTS_CHUNK_SCRIPT, locator[0], locator[1], root, token, start, start + chunk_size,
+                )
+                for webelement, tag_name in zip(webelements, tag_names):
+                    yield _ConvertToWebelementWrapper._convert_into_webelementwrapper(webelement, tag_name)
+                if token is None:
+                    return
+                start += chunk_size
+        finally:
+            # Iterating was stopped before the end, found elements are not needed anymore.
+            if token is not None:
+                try:
+                    self._driver.execute_script(_FORGET_ELEMENTS_SCRIPT, token)
+                except selenium_exc.WebDriverException:
+                    pass
+
+    def get_texts(self, *args, **kwds):
+        """
+        Returns texts of all elements found by params of
+        :py:meth:`~._WebdriverBaseWrapper.get_elms`. See :py:meth:`.extract`.
+
+        .. versionadded:: 2.9
+        """
+        return [values['text'] for values in self.extract(('text',), *args, **kwds)]
+
+    def get_attributes(self, attribute, *args, **kwds):
+        """
+        Returns values of HTML ``attribute`` of all elements found by params of
+        :py:meth:`~._WebdriverBaseWrapper.get_elms`. Missing attribute is
+        ``None``. See :py:meth:`.extract`.
+
+        .. versionadded:: 2.9
+        """
+        field = '@' + attribute
+        return [values[field] for values in self.extract((field,), *args, **kwds)]
+
+    def extract(self, fields, *args, **kwds):
+        """
+        Returns list of dictionaries with ``fields`` of all elements found by
+        params of :py:meth:`~._WebdriverBaseWrapper.get_elms`. All fields of
+        all elements are read by one call (elements are usually found by the
+        same call), which is much faster than reading ``text`` or calling
+        ``get_attribute`` on every element.
+
+        Field can be ``text`` (inner text of element, the same as ``text`` for
+        visible element), ``tag_name``, name of HTML attribute prefixed by
+        ``@`` or name of JS property.
+
+        .. code-block:: python
+
+            rows = driver.extract(('text', '@href'), tag_name='a')
+            # [{'text': 'Home', '@href': '/'}, ...]
+
+        .. versionadded:: 2.9
+        """
+        fields = list(fields)
+        params = _get_elms_params(args, kwds)
+        locator = _compile_locator(**params)
+        if locator:
+            root = None if self._driver is self else self
+            result = self._driver.execute_script(_EXTRACT_SCRIPT, locator[0], locator[1], root, None, fields)
+        else:
+            elms = self.get_elms(**params)
+            if not elms:
+                return []
+            result = self._driver.execute_script(_EXTRACT_SCRIPT, None, None, None, elms, fields)
+        return [dict(zip(fields, values)) for values in result or []]
 
     def find_element(self, by=By.ID, value=None):
         callback = self._get_seleniums_driver_class().find_element
@@ -225,14 +735,7 @@ class _WebdriverBaseWrapper:
         return self._find_element_or_elements(callback, by, value)
 
     def _get_seleniums_driver_class(self):
-        next_is_selenium_driver_class = False
-        driver_class = None
-        for cls in self.__class__.mro():
-            if next_is_selenium_driver_class:
-                driver_class = cls
-                break
-            if cls is _WebdriverBaseWrapper:
-                next_is_selenium_driver_class = True
+        driver_class = self._seleniums_driver_class
         if not driver_class:
             raise Exception('WebDriver class not found')
         return driver_class
@@ -263,10 +766,8 @@ class _WebdriverBaseWrapper:
                 selenium_exc.ElementNotSelectableException,
         ) as exc:
             if by in self._by_to_string_param_map:
-                msg = _create_exception_msg(**{
+                msg = _LazyExceptionMsg(lambda: self.current_url, self._driver, **{
                     self._by_to_string_param_map[by]: value,
-                    'url': self.current_url,
-                    'driver': self._driver,
                 })
             else:
                 msg = ''
@@ -287,16 +788,20 @@ class _WebdriverBaseWrapper:
         .. versionchanged:: 2.6
             Returned functionality back in favor of new method
             :py:meth:`~._WebdriverBaseWrapper.wait_for_element_show`.
+        .. versionchanged:: 2.9
+            Waits by ``MutationObserver``, see :py:attr:`~._WebdriverBaseWrapper.use_mutation_observer`.
+            Returns element found during waiting instead of looking for it again.
         """
         if not timeout:
             timeout = self.default_wait_timeout
         if not message:
-            message = _create_exception_msg(*args, url=self.current_url, **kwds)
-        self.wait(timeout).until(lambda driver: driver.get_elm(*args, **kwds), message=message)
+            message = self._create_lazy_exception_msg(args, kwds)
+        elms = self._wait_for_elements(
+            'present', lambda driver: driver.get_elms(*args, **kwds), timeout, message, args, kwds,
+        )
 
         # Also return that element for which is waiting.
-        elm = self.get_elm(*args, **kwds)
-        return elm
+        return elms[0]
 
     def wait_for_element_show(self, timeout=None, message='', *args, **kwds):
         """
@@ -309,29 +814,27 @@ class _WebdriverBaseWrapper:
             selenium.webdriver.support.wait.WebDriverWait(driver, timeout).until(lambda driver: driver.get_elm(...))
 
         .. versionadded:: 2.6
+        .. versionchanged:: 2.9
+            Waits by ``MutationObserver``, see :py:attr:`~._WebdriverBaseWrapper.use_mutation_observer`.
+            Returns first visible element found during waiting instead of
+            looking for first element again.
         """
         if not timeout:
             timeout = self.default_wait_timeout
         if not message:
-            message = _create_exception_msg(*args, url=self.current_url, **kwds)
+            message = self._create_lazy_exception_msg(args, kwds)
 
         def callback(driver):
-            elms = driver.get_elms(*args, **kwds)
-            if not elms:
-                return False
             try:
-                if all(not elm.is_displayed() for elm in elms):
-                    return False
+                return driver.get_displayed_elms(*args, **kwds)
             except selenium_exc.StaleElementReferenceException:
                 # Some element can be out, but need to check all elements.
                 # Let's wait for another run.
                 return False
-            return True
-        self.wait(timeout).until(callback, message=message)
+        elms = self._wait_for_elements('show', callback, timeout, message, args, kwds)
 
         # Also return that element for which is waiting.
-        elm = self.get_elm(*args, **kwds)
-        return elm
+        return elms[0]
 
     def wait_for_element_hide(self, timeout=None, message='', *args, **kwds):
         """
@@ -343,25 +846,105 @@ class _WebdriverBaseWrapper:
             selenium.webdriver.support.wait.WebDriverWait(driver, timeout).until(lambda driver: not driver.get_elm(...))
 
         .. versionadded:: 2.0
+        .. versionchanged:: 2.9
+            Waits by ``MutationObserver``, see :py:attr:`~._WebdriverBaseWrapper.use_mutation_observer`.
         """
         if not timeout:
             timeout = self.default_wait_timeout
         if not message:
-            message = 'Element {} still visible.'.format(_create_exception_msg(*args, url=self.current_url, **kwds))
+            message = self._create_lazy_exception_msg(args, kwds, template='Element {} still visible.')
 
         def callback(driver):
-            elms = driver.get_elms(*args, **kwds)
-            if not elms:
-                return True
             try:
-                if all(not elm.is_displayed() for elm in elms):
-                    return True
+                return not driver.get_displayed_elms(*args, **kwds)
             except selenium_exc.StaleElementReferenceException:
                 # Some element can be out, but need to check all elements.
                 # Let's wait for another run.
                 return False
-            return False
-        self.wait(timeout).until(callback, message=message)
+        self._wait_for_elements('hide', callback, timeout, message, args, kwds)
+
+    def _wait_for_elements(self, condition, callback, timeout, message, args, kwds):
+        """
+        Waits until elements found by ``args`` and ``kwds`` (params of
+        :py:meth:`~._WebdriverBaseWrapper.get_elms`) meet ``condition``
+        (``present``, ``show`` or ``hide``). It waits by
+        :py:meth:`~._WebdriverBaseWrapper._wait_by_mutation_observer` if it's
+        possible, otherwise (or when it fails or finds nothing before
+        ``timeout``) ``callback`` is polled for the rest of ``timeout``.
+        """
+        deadline = time.time() + timeout
+        locator = self._get_observable_locator(args, kwds)
+        if locator:
+            try:
+                result = self._wait_by_mutation_observer(condition, locator, timeout)
+            except selenium_exc.WebDriverException:
+                # Waiting in browser failed, let's try it by polling.
+                pass
+            else:
+                if result is not None:
+                    return result
+                #  Browser waited whole timeout (up to rounding), polling
+                #+ would only sleep longer.
+                if deadline - time.time() < POLL_FREQUENCY:
+                    raise selenium_exc.TimeoutException(str(message))
+                #  Condition wasn't met in browser and there is still some
+                #+ time. Let's check it by polling to not miss some change
+                #+ which page didn't tell about.
+        try:
+            return WebDriverWait(self, max(deadline - time.time(), 0)).until(callback, message=message)
+        except selenium_exc.TimeoutException as exc:
+            # Lazy message is created now when it's really needed.
+            exc.msg = str(exc.msg)
+            raise
+
+    def _create_lazy_exception_msg(self, args, kwds, template='{}'):
+        params = dict(zip(_GET_ELMS_PARAMS, args), **kwds)
+        return _LazyExceptionMsg(lambda: self.current_url, self._driver, template, **params)
+
+    def _get_observable_locator(self, args, kwds):
+        #  Waiting from element follows setting of driver, so it can be turned
+        #+ off by one attribute.
+        if not self._driver.use_mutation_observer or not self._driver._async_scripts_supported:
+            return None
+        return _compile_locator(*args, **kwds)
+
+    def _wait_by_mutation_observer(self, condition, locator, timeout):
+        """
+        Waits for ``condition`` in browser by ``MutationObserver``, so it ends
+        right after change of DOM. Returns wrapped elements (found or visible
+        ones) or ``None`` when time is up.
+        """
+        script = _WAIT_FOR_ELEMENTS_SCRIPT if condition == 'present' else _WAIT_FOR_VISIBILITY_SCRIPT
+        root = None if self._driver is self else self
+        result = self._wait_in_browser(script, (locator[0], locator[1], root, condition), timeout)
+        return _ConvertToWebelementWrapper._convert_result(self._driver, result)
+
+    def _wait_in_browser(self, script, args, timeout):
+        """
+        Calls asynchronous ``script`` with ``args`` and timeout in milliseconds
+        as the last argument by slices of ``_mutation_observer_slice`` seconds,
+        so it does not hit script timeout of driver, until it returns something
+        else than ``None`` or ``timeout`` is up. Returns the last result.
+
+        When script timeout of driver is even shorter than a slice, next waits
+        use shorter slices (or polling when it would be too short) and
+        ``TimeoutException`` is raised, so caller can fall back to polling
+        as with any other ``WebDriverException``.
+        """
+        driver = self._driver
+        deadline = time.time() + timeout
+        while True:
+            remaining = deadline - time.time()
+            script_timeout = min(max(remaining, 0), driver._mutation_observer_slice)
+            try:
+                result = driver.execute_async_script(script, *args, int(script_timeout * 1000))
+            except selenium_exc.TimeoutException:
+                driver._mutation_observer_slice = script_timeout / 2
+                if driver._mutation_observer_slice < POLL_FREQUENCY:
+                    driver._async_scripts_supported = False
+                raise
+            if result is not None or remaining <= script_timeout:
+                return result
 
     def wait(self, timeout=None):
         """
@@ -392,10 +975,147 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
     Class wrapping :py:class:`selenium.WebDriver <selenium.webdriver.remote.webdriver.WebDriver>`.
     """
 
+    suggestions = True
+    """
+    Messages of exceptions about missing element contain suggestion (e.g.
+    "did you mean id=someid?") when ``python-Levenshtein`` is installed.
+    Collected ids, classes and names are cached until DOM of page is changed,
+    but it's still one call to browser which you can turn off by this
+    attribute. For temporary turning off use :py:meth:`.without_suggestions`.
+
+    .. versionadded:: 2.9
+    """
+
+    track_alerts = False
+    """
+    By default :py:meth:`.close_alert` is called before every check of errors
+    and every screenshot, which is one useless call in usual case without
+    alert. When this attribute is set, driver tracks alerts and closes them
+    only when some is pending, and :py:meth:`.wait_for_alert` ends right when
+    alert is opened instead of polling.
+
+    Driver has to be created with capability ``unhandledPromptBehavior`` set
+    to ``ignore``, otherwise alerts are closed by browser before they can be
+    tracked.
+
+    .. versionadded:: 2.9
+    """
+
+    base_url = None
+    """
+    URL used by :py:meth:`.get_url` (and so by :py:meth:`.go_to`) for relative
+    paths when no real page is open yet (``about:blank``, ``data:``, ...).
+    Otherwise scheme and domain of current page is used.
+    With pytest it's set from ``config.webdriverwrapper_testing_url``, with
+    :py:class:`~webdriverwrapper.unittest.testcase.WebdriverTestCase` from
+    ``domain``.
+
+    .. versionadded:: 2.9
+    """
+
+    #  Set to False when driver can't run asynchronous scripts long enough
+    #+ for waiting in browser, even by shorter slices.
+    _async_scripts_supported = True
+
+    #  Used only with track_alerts. Alert is pending when some command failed
+    #+ on unexpected alert and it was not closed yet.
+    _alert_pending = False
+    _closing_unexpected_alerts = False
+
     def __init__(self, *args, **kwds):
+        #  Known window handles with last known title and URL and handle of
+        #+ current window (None when it's not known). See _track_windows.
+        self._windows = {}
+        self._current_window_handle = None
+        #  Scheme and domain of last visited page, see get_url.
+        self._origin = None
         super().__init__(*args, **kwds)
         self.screenshot_path = None
 
+    def execute(self, driver_command, params=None):
+        if driver_command not in _ORIGIN_KEEPING_COMMANDS:
+            # Page could be navigated, so its URL has to be read again.
+            self._origin = None
+        if self.track_alerts:
+            response = self._execute_tracking_alerts(driver_command, params)
+        else:
+            response = super().execute(driver_command, params)
+        if driver_command in _WINDOW_COMMANDS:
+            self._track_windows(driver_command, params or {}, response.get('value'))
+        return response
+
+    def _execute_tracking_alerts(self, driver_command, params):
+        try:
+            response = super().execute(driver_command, params)
+        except selenium_exc.UnexpectedAlertPresentException:
+            self._alert_pending = True
+            if not self._closing_unexpected_alerts or driver_command in _ALERT_COMMANDS:
+                raise
+            #  Browser could close the alert already by its default
+            #+ ``unhandledPromptBehavior``, so the call is repeated anyway.
+            self.close_alert(ignore_exception=True)
+            return super().execute(driver_command, params)
+        except selenium_exc.NoAlertPresentException:
+            self._alert_pending = False
+            raise
+        if driver_command in _ALERT_COMMANDS:
+            self._alert_pending = driver_command not in _ALERT_CLOSING_COMMANDS
+        return response
+
+    def _track_windows(self, driver_command, params, value):
+        """
+        Keeps open window handles with last known title and URL up to date
+        from results of commands, so switching between windows does not have
+        to visit every window. Known title and URL are only hints, it can be
+        changed by page itself. Also keeps scheme and domain of current page
+        for :py:meth:`.get_url` (only real ones, not of ``about:blank`` and
+        similar).
+        """
+        if driver_command in (Command.GET, Command.GET_CURRENT_URL):
+            url = params.get('url') if driver_command == Command.GET else value
+            origin = urlparse(url)[:2] if url else None
+            self._origin = origin if origin and origin[1] else None
+
+        windows = self._windows
+        if driver_command in _WINDOW_HANDLE_COMMANDS:
+            self._current_window_handle = value
+            windows.setdefault(value, {'title': None, 'url': None})
+        elif driver_command in _WINDOW_HANDLES_COMMANDS:
+            self._update_window_handles(value)
+        elif driver_command == Command.SWITCH_TO_WINDOW:
+            if 'handle' in params:
+                self._current_window_handle = params['handle']
+                windows.setdefault(params['handle'], {'title': None, 'url': None})
+            else:
+                # Switched by name, handle is known only if it's the same.
+                self._current_window_handle = params.get('name') if params.get('name') in windows else None
+        elif driver_command == Command.CLOSE:
+            windows.pop(self._current_window_handle, None)
+            self._current_window_handle = None
+            # W3C returns handles of remaining windows.
+            if isinstance(value, list):
+                self._update_window_handles(value)
+        elif driver_command == Command.QUIT:
+            windows.clear()
+            self._current_window_handle = None
+        elif self._current_window_handle in windows:
+            window = windows[self._current_window_handle]
+            if driver_command == Command.GET:
+                window.update(title=None, url=params.get('url'))
+            elif driver_command == Command.GET_CURRENT_URL:
+                window['url'] = value
+            elif driver_command == Command.GET_TITLE:
+                window['title'] = value
+
+    def _update_window_handles(self, window_handles):
+        windows = self._windows
+        for window_handle in set(windows) - set(window_handles):
+            del windows[window_handle]
+        for window_handle in window_handles:
+            windows.setdefault(window_handle, {'title': None, 'url': None})
+        if self._current_window_handle not in windows:
+            self._current_window_handle = None
+
     @property
     def _driver(self):
         """
@@ -404,6 +1124,13 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
         """
         return self
 
+    def quit(self):
+        try:
+            super().quit()
+        finally:
+            # Connections kept for downloads.
+            _close_session(self)
+
     @property
     def html(self):
         """
@@ -436,6 +1163,27 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
 
         self.get_screenshot_as_file('{}/{}.png'.format(self.screenshot_path, screenshot_name))
 
+    @contextlib.contextmanager
+    def without_suggestions(self):
+        """
+        Context manager turning off suggestions in messages of exceptions.
+        Useful for hot loops where missing elements are expected.
+
+        .. code-block:: python
+
+            with driver.without_suggestions():
+                for item in items:
+                    ...
+
+        .. versionadded:: 2.9
+        """
+        suggestions = self.suggestions
+        self.suggestions = False
+        try:
+            yield self
+        finally:
+            self.suggestions = suggestions
+
     def break_point(self):
         """
         Stops testing and wait for pressing enter to continue.
@@ -472,6 +1220,13 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
         :py:func:`urllib.urlencode`.
 
         .. versionadded:: 2.0
+
+        .. versionchanged:: 2.9
+            Scheme and domain of page opened by
+            :py:meth:`~selenium.webdriver.remote.webdriver.WebDriver.get` are
+            reused without call to browser until some command which can
+            navigate (click, submit, back, script, ...) is called. When no
+            real page is open, :py:attr:`.base_url` is used.
         """
         if urlparse(path).netloc:
             return path
@@ -479,11 +1234,20 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
         if isinstance(query, dict):
             query = urlencode(query)
 
-        url_parts = urlparse(self.current_url)
+        if not path:
+            # Path of current page is used.
+            url_parts = urlparse(self.current_url)
+        elif self._origin:
+            url_parts = self._origin
+        else:
+            url_parts = urlparse(self.current_url)
+            # No real page is open yet (about:blank, data:, ...).
+            if not url_parts.netloc and self.base_url:
+                url_parts = urlparse(self.base_url)
         new_url_parts = (
-            url_parts.scheme,
-            url_parts.netloc,
-            path or url_parts.path,
+            url_parts[0],  # scheme
+            url_parts[1],  # netloc
+            path or url_parts[2],
             None,  # params
             query,
             None,  # fragment
@@ -492,11 +1256,27 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
 
         return url
 
+    def forget_origin(self):
+        """
+        Forgets scheme and domain of last visited page used by
+        :py:meth:`.get_url`, so next relative URL is made from
+        :py:attr:`~selenium.webdriver.remote.webdriver.WebDriver.current_url`.
+        Call it when page redirected to another domain by itself (commands
+        which can navigate forget it automatically).
+
+        .. versionadded:: 2.9
+        """
+        self._origin = None
+
     def switch_to_window(self, window_name=None, title=None, url=None):
         """
         WebDriver implements switching to other window only by it's name. With
         wrapper there is also option to switch by title of window or URL. URL
         can be also relative path.
+
+        .. versionchanged:: 2.9
+            Windows with last known title or URL matching are checked first,
+            so it does not have to visit every window.
         """
         if window_name:
             self.switch_to.window(window_name)
@@ -505,20 +1285,40 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
         if url:
             url = self.get_url(path=url)
 
-        for window_handle in self.window_handles:
-            self.switch_to.window(window_handle)
+        for window_handle in self._get_window_candidates(self.window_handles, title, url):
+            if window_handle != self._current_window_handle:
+                self.switch_to.window(window_handle)
             if title and self.title == title:
                 return
             if url and self.current_url == url:
                 return
         raise selenium_exc.NoSuchWindowException('Window (title=%s, url=%s) not found.' % (title, url))
 
+    def _get_window_candidates(self, window_handles, title, url):
+        """
+        Sorts ``window_handles`` by last known title and URL: matching windows
+        first, then unknown ones and windows not matching at the end.
+        """
+        def match(window_handle):
+            window = self._windows.get(window_handle, {})
+            known = [
+                window.get(key) == value
+                for key, value in (('title', title), ('url', url))
+                if value and window.get(key) is not None
+            ]
+            if any(known):
+                return 0
+            if not known:
+                return 1
+            return 2
+        return sorted(window_handles, key=match)
+
     def close_window(self, window_name=None, title=None, url=None):
         """
         WebDriver implements only closing current window. If you want to close
         some window without having to switch to it, use this method.
         """
-        main_window_handle = self.current_window_handle
+        main_window_handle = self._current_window_handle or self.current_window_handle
         self.switch_to_window(window_name, title, url)
         self.close()
         self.switch_to_window(main_window_handle)
@@ -527,9 +1327,15 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
         """
         Closes all not current windows. Useful for tests - after each test you
         can automatically close all windows.
+
+        .. versionchanged:: 2.9
+            Only one call is made when there is no other window.
         """
-        main_window_handle = self.current_window_handle
-        for window_handle in self.window_handles:
+        window_handles = self.window_handles
+        if len(window_handles) <= 1:
+            return
+        main_window_handle = self._current_window_handle or self.current_window_handle
+        for window_handle in window_handles:
             if window_handle == main_window_handle:
                 continue
             self.switch_to_window(window_handle)
@@ -541,7 +1347,13 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
         JS alerts all blocking. This method closes it. If there is no alert,
         method raises exception. In tests is good to call this method with
         ``ignore_exception`` setted to ``True`` which will ignore any exception.
+
+        .. versionchanged:: 2.9
+            With :py:attr:`.track_alerts` and ``ignore_exception`` it makes
+            no call when there is no pending alert.
         """
+        if ignore_exception and self.track_alerts and not self._alert_pending:
+            return
         try:
             alert = self.get_alert()
             alert.accept()
@@ -549,6 +1361,28 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
             if not ignore_exception:
                 raise
 
+    @contextlib.contextmanager
+    def unexpected_alerts_closed(self):
+        """
+        Context manager closing alerts which would block calls inside. With
+        :py:attr:`.track_alerts` alert is closed only when some call fails
+        on it and the call is repeated, so there is no useless call.
+
+        .. code-block:: python
+
+            with driver.unexpected_alerts_closed():
+                driver.make_screenshot()
+
+        .. versionadded:: 2.9
+        """
+        self.close_alert(ignore_exception=True)
+        closing = self._closing_unexpected_alerts
+        self._closing_unexpected_alerts = True
+        try:
+            yield
+        finally:
+            self._closing_unexpected_alerts = closing
+
     def get_alert(self):
         """
         Returns instance of :py:obj:`~selenium.webdriver.common.alert.Alert`.
@@ -559,12 +1393,31 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
         """
         Shortcut for waiting for alert. If it not ends with exception, it
         returns that alert. Detault timeout is `~.default_wait_timeout`.
+
+        .. versionchanged:: 2.9
+            With :py:attr:`.track_alerts` it waits in browser and ends right
+            when alert is opened.
         """
         if not timeout:
             timeout = self.default_wait_timeout
+        deadline = time.time() + timeout
 
         alert = Alert(self)
 
+        if self.track_alerts and self._async_scripts_supported:
+            try:
+                shown = self._wait_in_browser(_WAIT_FOR_ALERT_SCRIPT, (), timeout)
+            except selenium_exc.UnexpectedAlertPresentException:
+                return alert
+            except selenium_exc.WebDriverException:
+                # Waiting in browser failed, let's try it by polling.
+                pass
+            else:
+                if not shown:
+                    raise selenium_exc.TimeoutException('Alert not shown.')
+                self._alert_pending = True
+                return alert
+
         # There is no better way how to check alert appearance
         def alert_shown(driver):
             try:
@@ -573,11 +1426,11 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
             except selenium_exc.NoAlertPresentException:
                 return False
 
-        self.wait(timeout).until(alert_shown)
+        WebDriverWait(self, max(deadline - time.time(), 0)).until(alert_shown)
 
         return alert
 
-    def download_url(self, url=None):
+    def download_url(self, url=None, stream=False, method=None, conditional=False):
         """
         With WebDriver you can't check status code or headers. For this you have
         to make classic request. But web pages needs cookies and by this it gets
@@ -588,26 +1441,82 @@ class _WebdriverWrapper(WebdriverWrapperErrorMixin, WebdriverWrapperInfoMixin, _
         will be used.
 
         Returns :py:obj:`~webdriverwrapper.download._Download` instance.
+
+        .. versionchanged:: 2.9
+            All downloads of driver use one :py:class:`requests.Session`, so
+            connections are reused. Cookies of session are synced from
+            browser before every download. Added ``stream`` param (body is
+            not loaded to memory, see
+            :py:meth:`~webdriverwrapper.download._Download.iter_content`),
+            ``method`` (only ``head`` can be forced) and ``conditional``
+            params, see :py:obj:`~webdriverwrapper.download._Download`.
+        """
+        return DownloadUrl(self, url, stream, method, conditional)
+
+    def check_links(self, scope_elm=None, concurrency=8, timeout=30):
         """
-        return DownloadUrl(self, url)
+        Checks all links (``<a href>``) on page or in ``scope_elm``. Links are
+        collected by one call and every URL is checked only once with cookies
+        of browser by ``HEAD`` request (``GET`` when ``HEAD`` fails), up to
+        ``concurrency`` requests at once. Links to other sites are checked as
+        well, but cookies are sent only to hosts they belong to.
 
-    def fill_out_and_submit(self, data, prefix='', turbo=False):
+        Returns :py:obj:`~webdriverwrapper.download._LinksReport` with status
+        code and latency of every link.
+
+        .. code-block:: python
+
+            report = driver.check_links()
+            assert not report.failed, report.failed
+
+        .. versionadded:: 2.9
+        """
+        return _check_links(self, scope_elm, concurrency, timeout)
+
+    def fill_out_and_submit(self, data, prefix='', turbo=False, **kwds):
         """
         Shortcut for filling out first ``<form>`` on page. See
         :py:class:`~webdriverwrapper.forms.Form` for more information.
 
         .. versionadded:: 2.0
+        .. versionchanged:: 2.9
+            Other keyword arguments (``by_script``, ``typed_fields``) are
+            passed to form.
         """
-        return self.get_elm(tag_name='form').fill_out_and_submit(data, prefix, turbo)
+        return self.get_elm(tag_name='form').fill_out_and_submit(data, prefix, turbo, **kwds)
 
-    def fill_out(self, data, prefix='', turbo=False):
+    def fill_out(self, data, prefix='', turbo=False, **kwds):
         """
         Shortcut for filling out first ``<form>`` on page. See
         :py:class:`~webdriverwrapper.forms.Form` for more information.
 
         .. versionadded:: 2.0
+        .. versionchanged:: 2.9
+            Other keyword arguments (``by_script``, ``typed_fields``) are
+            passed to form.
         """
-        return self.get_elm(tag_name='form').fill_out(data, prefix, turbo)
+        return self.get_elm(tag_name='form').fill_out(data, prefix, turbo, **kwds)
+
+
+def _make_table_header(header_row):
+    """
+    Returns unique keys of header. Header cell spanning more columns (or more
+    cells with the same text) gets suffix ``_2``, ``_3``, ... in next columns.
+    """
+    keys = []
+    counts = {}
+    for name in header_row:
+        counts[name] = counts.get(name, 0) + 1
+        keys.append(name if counts[name] == 1 else '{}_{}'.format(name, counts[name]))
+    return keys
+
+
+def _make_table_rows(header, rows):
+    for row in rows:
+        values = dict(zip(header, row + [None] * (len(header) - len(row))))
+        # Cells out of header are kept under index of their column.
+        values.update(enumerate(row[len(header):], len(header)))
+        yield values
 
 
 class _WebElementWrapper(_WebdriverBaseWrapper, WebElement):
@@ -667,7 +1576,50 @@ class _WebElementWrapper(_WebdriverBaseWrapper, WebElement):
         ) as exc:
             raise exc.__class__('Problem clearing element at {}.'.format(self.current_url))
 
-    def download_file(self):
+    def extract_table(self, header=True):
+        """
+        Returns texts of all cells of table by one call. With ``header`` first
+        row is used as header and rows are returned as dictionaries by header,
+        otherwise rows are lists. Cells with ``colspan`` or ``rowspan`` are
+        repeated in all columns and rows they span.
+
+        Keys of columns are unique, header spanning more columns has suffix
+        ``_2``, ``_3``, ... in next columns (so ``price``, ``price_2`` for
+        ``<th colspan="2">price</th>``). Cells out of header are under index
+        of their column.
+
+        For really big tables use :py:meth:`.iter_table`.
+
+        .. versionadded:: 2.9
+        """
+        rows = self._driver.execute_script(_EXTRACT_TABLE_SCRIPT, self, 0, None)
+        if not header:
+            return rows
+        return list(_make_table_rows(_make_table_header(rows[0]), rows[1:])) if rows else []
+
+    def iter_table(self, header=True, chunk_size=1000):
+        """
+        The same as :py:meth:`.extract_table`, but rows are read by chunks of
+        ``chunk_size`` rows, so there is no huge response from browser.
+
+        .. versionadded:: 2.9
+        """
+        header_keys = None
+        start = 0
+        while True:
+            rows = self._driver.execute_script(_EXTRACT_TABLE_SCRIPT, self, start, start + chunk_size)
+            start += chunk_size
+            is_last_chunk = len(rows) < chunk_size
+            if header and header_keys is None and rows:
+                header_keys = _make_table_header(rows.pop(0))
+            if header:
+                yield from _make_table_rows(header_keys, rows)
+            else:
+                yield from rows
+            if is_last_chunk:
+                return
+
+    def download_file(self, stream=False, method=None, conditional=False):
         """
         With WebDriver you can't check status code or headers. For this you have
         to make classic request. But web pages needs cookies and data from forms
@@ -676,8 +1628,16 @@ class _WebElementWrapper(_WebdriverBaseWrapper, WebElement):
         It can handle downloading of page/file by link or any type of form.
 
         Returns :py:obj:`~webdriverwrapper.download._Download` instance.
+
+        .. versionchanged:: 2.9
+            Added ``stream`` param (body is not loaded to memory, see
+            :py:meth:`~webdriverwrapper.download._Download.iter_content`),
+            ``method`` (only ``head`` can be forced) and ``conditional``
+            params, see :py:obj:`~webdriverwrapper.download._Download`.
+            Forcing ``head`` on form with method ``post`` raises exception,
+            because ``HEAD`` request can't send the same data.
         """
-        return DownloadFile(self)
+        return DownloadFile(self, stream, method, conditional)
 
 
 class _SelectWrapper(_WebElementWrapper, Select):